@@ -3,7 +3,7 @@
 import gopropy
 
 # Load telemetry from a GoPro video
-telemetry = gopropy.load("../data/river_side_1.MP4")
+telemetry = gopropy.load("../data/river_side_1.MP4", cache=True)
 
 print(f"Loaded: {telemetry}")
 print(f"\nAvailable streams: {telemetry.list_streams()}\n")
@@ -5,6 +5,7 @@ This example demonstrates exporting telemetry data to different formats:
 - JSON (all streams in one file)
 - HDF5 (binary format, good for large datasets)
 - NPZ (NumPy compressed format)
+- Parquet (columnar, one file per stream)
 """
 
 import sys
@@ -16,7 +17,7 @@ import numpy as np
 
 # Load telemetry
 print("Loading GoPro telemetry...")
-telemetry = gopropy.load("../data/river_side_1.MP4")
+telemetry = gopropy.load("../data/river_side_1.MP4", cache=True)
 print(f"✓ Loaded {len(telemetry.list_streams())} streams\n")
 
 # Export to different formats
@@ -37,6 +38,7 @@ print("   ✓ Exported to exports/telemetry.json")
 # 3. HDF5 Export (binary, compressed, good for large data)
 print("\n3. HDF5 Export (binary, compressed, efficient)")
 try:
+    # gzip by default; compression="lzf" is faster but only readable via h5py
     telemetry.export_hdf5("exports/telemetry.h5")
     print("   ✓ Exported to exports/telemetry.h5")
 
@@ -58,6 +60,10 @@ print("\n4. NPZ Export (NumPy compressed, easy to load)")
 telemetry.export_npz("exports/telemetry.npz")
 print("   ✓ Exported to exports/telemetry.npz")
 
+# Uncompressed NPZ is larger but much faster to write and load
+telemetry.export_npz("exports/telemetry_raw.npz", compression="none")
+print("   ✓ Exported to exports/telemetry_raw.npz (uncompressed)")
+
 # Show how to load NPZ data back
 print("\n   Loading data back from NPZ:")
 data = np.load("exports/telemetry.npz", allow_pickle=True)
@@ -65,6 +71,21 @@ print(f"   - Video file: {data['_video_file']}")
 print(f"   - Streams: {data['_stream_names'][:5]}...")
 print(f"   - Accelerometer shape: {data['Accelerometer_data'].shape}")
 
+# 5. Parquet Export (columnar, one file per stream)
+print("\n5. Parquet Export (columnar, compressed, one file per stream)")
+try:
+    telemetry.export_parquet("exports/parquet")
+    print("   ✓ Exported to exports/parquet/")
+
+    # Show how to load Parquet data back
+    print("\n   Loading data back from Parquet:")
+    import pandas as pd
+
+    accel_df = pd.read_parquet("exports/parquet/Accelerometer.parquet")
+    print(f"   - Accelerometer columns: {list(accel_df.columns)}")
+except ImportError:
+    print("   ⚠ pyarrow not installed (pip install pyarrow), skipping Parquet export")
+
 print("\n" + "=" * 60)
 print("Export summary:")
 print("=" * 60)
@@ -73,7 +94,8 @@ import os
 
 def get_size(path):
     if os.path.isdir(path):
-        total = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+        # scandir entries carry their own stat info, avoiding a path lookup per file
+        total = sum(entry.stat().st_size for entry in os.scandir(path))
         return total / 1024 / 1024  # MB
     return os.path.getsize(path) / 1024 / 1024  # MB
 
@@ -83,9 +105,13 @@ print(f"JSON: {get_size('exports/telemetry.json'):.2f} MB")
 if os.path.exists("exports/telemetry.h5"):
     print(f"HDF5: {get_size('exports/telemetry.h5'):.2f} MB (compressed)")
 print(f"NPZ:  {get_size('exports/telemetry.npz'):.2f} MB (compressed)")
+print(f"NPZ:  {get_size('exports/telemetry_raw.npz'):.2f} MB (uncompressed)")
+if os.path.exists("exports/parquet"):
+    print(f"Parquet: {get_size('exports/parquet'):.2f} MB (directory)")
 
 print("\nRecommendations:")
 print("- CSV: Best for human inspection, Excel/spreadsheet software")
 print("- JSON: Good for web apps, JavaScript integration")
 print("- HDF5: Best for large datasets, Python/MATLAB/scientific computing")
 print("- NPZ: Best for Python-only workflows, quick load with NumPy")
+print("- Parquet: Best for pandas/Polars/DuckDB/Spark analytics")
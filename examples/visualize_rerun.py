@@ -22,7 +22,7 @@ from gopropy.visualization import visualize
 
 # Load telemetry from the sample video
 print("Loading GoPro telemetry...")
-telemetry = gopropy.load("../data/river_side_1.MP4")
+telemetry = gopropy.load("../data/river_side_1.MP4", cache=True)
 
 print(f"Loaded {len(telemetry.list_streams())} streams:")
 for stream_name in telemetry.list_streams():
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Generate model documentation from models.py configuration."""
 
+import io
 import sys
 from pathlib import Path
 
@@ -13,14 +14,20 @@ from gopropy.models import GOPRO_MODELS_BASE, build_model_config
 def generate_models_markdown() -> str:
     """Generate markdown documentation for all GoPro models."""
     
-    lines = ["# GoPro Model Support\n"]
-    lines.append("This document details the metadata support for different GoPro camera models.\n")
-    lines.append("Based on the official [GPMF Parser documentation](https://github.com/gopro/gpmf-parser).\n")
-    lines.append("\n## Supported Models\n")
+    buf = io.StringIO()
+
+    def add(line: str = ""):
+        buf.write(line)
+        buf.write("\n")
+
+    add("# GoPro Model Support\n")
+    add("This document details the metadata support for different GoPro camera models.\n")
+    add("Based on the official [GPMF Parser documentation](https://github.com/gopro/gpmf-parser).\n")
+    add("\n## Supported Models\n")
     
     # Create summary table
-    lines.append("| Model | Year | Firmware | Inherits From | Added FourCCs |")
-    lines.append("|-------|------|----------|---------------|---------------|")
+    add("| Model | Year | Firmware | Inherits From | Added FourCCs |")
+    add("|-------|------|----------|---------------|---------------|")
     
     models = sorted(
         [(k, v) for k, v in GOPRO_MODELS_BASE.items() if k != "GENERIC"],
@@ -28,73 +35,71 @@ def generate_models_markdown() -> str:
     )
     
     for model_name, config in models:
-        built = build_model_config(model_name)
         added_count = len(config.added_fourccs)
         inherits = config.inherits_from or "—"
-        lines.append(
+        add(
             f"| {config.display_name} | {config.release_year} | "
             f"{config.firmware_version} | {inherits} | {added_count} |"
         )
     
     # Detailed sections for each model
-    lines.append("\n## Model Details\n")
+    add("\n## Model Details\n")
     
     for model_name, config in models:
         built = build_model_config(model_name)
         
-        lines.append(f"\n### {config.display_name}\n")
-        lines.append(f"**Release Year:** {config.release_year}  ")
-        lines.append(f"**Firmware Version:** {config.firmware_version}  ")
+        add(f"\n### {config.display_name}\n")
+        add(f"**Release Year:** {config.release_year}  ")
+        add(f"**Firmware Version:** {config.firmware_version}  ")
         if config.inherits_from:
-            lines.append(f"**Inherits From:** {config.inherits_from}  ")
+            add(f"**Inherits From:** {config.inherits_from}  ")
         if config.notes:
-            lines.append(f"**Notes:** {config.notes}  ")
-        lines.append("")
+            add(f"**Notes:** {config.notes}  ")
+        add()
         
         # Axis ordering
         if config.axis_order:
-            lines.append("**Axis Ordering:**")
+            add("**Axis Ordering:**")
             for fourcc, axes in sorted(config.axis_order.items()):
-                lines.append(f"- `{fourcc}`: {', '.join(axes)}")
-            lines.append("")
+                add(f"- `{fourcc}`: {', '.join(axes)}")
+            add()
         
         # Added FourCC codes
         if config.added_fourccs:
-            lines.append(f"**Added FourCC Codes ({len(config.added_fourccs)}):**")
+            add(f"**Added FourCC Codes ({len(config.added_fourccs)}):**")
             for fourcc in sorted(config.added_fourccs):
-                lines.append(f"- `{fourcc}`")
-            lines.append("")
+                add(f"- `{fourcc}`")
+            add()
         
         # Changed FourCC codes
         if config.changed_fourccs:
-            lines.append("**Changed FourCC Codes:**")
+            add("**Changed FourCC Codes:**")
             for fourcc, description in sorted(config.changed_fourccs.items()):
-                lines.append(f"- `{fourcc}`: {description}")
-            lines.append("")
+                add(f"- `{fourcc}`: {description}")
+            add()
         
         # Total supported FourCC codes
-        lines.append(f"**Total Supported FourCC Codes:** {len(built.supported_fourccs)}")
-        lines.append("")
+        add(f"**Total Supported FourCC Codes:** {len(built.supported_fourccs)}")
+        add()
     
     # Axis ordering explanation
-    lines.append("\n## Axis Ordering\n")
-    lines.append("**Important:** GoPro cameras do NOT use standard X, Y, Z axis ordering.\n")
-    lines.append("\n### IMU Sensors (Hero5+)\n")
-    lines.append("- **ACCL (Accelerometer):** Z, X, Y")
-    lines.append("- **GYRO (Gyroscope):** Z, X, Y")
-    lines.append("\nThis is documented in the official GPMF parser for Hero5 Black and Session,")
-    lines.append("and is assumed to continue for later models.\n")
-    lines.append("\n### Orientation Sensors (Hero8+)\n")
-    lines.append("- **CORI (Camera Orientation):** X, Y, Z, W (quaternion)")
-    lines.append("- **IORI (Image Orientation):** X, Y, Z, W (quaternion)")
-    lines.append("- **GRAV (Gravity Vector):** X, Y, Z")
-    lines.append("\n### GPS Data\n")
-    lines.append("GPS data is not in XYZ format:")
-    lines.append("- **GPS5:** Latitude, Longitude, Altitude, 2D Speed, 3D Speed")
-    lines.append("- **GPS9:** Latitude, Longitude, Altitude, 2D Speed, 3D Speed, Days since 2000, Seconds since midnight, DOP, Fix")
-    lines.append("")
+    add("\n## Axis Ordering\n")
+    add("**Important:** GoPro cameras do NOT use standard X, Y, Z axis ordering.\n")
+    add("\n### IMU Sensors (Hero5+)\n")
+    add("- **ACCL (Accelerometer):** Z, X, Y")
+    add("- **GYRO (Gyroscope):** Z, X, Y")
+    add("\nThis is documented in the official GPMF parser for Hero5 Black and Session,")
+    add("and is assumed to continue for later models.\n")
+    add("\n### Orientation Sensors (Hero8+)\n")
+    add("- **CORI (Camera Orientation):** X, Y, Z, W (quaternion)")
+    add("- **IORI (Image Orientation):** X, Y, Z, W (quaternion)")
+    add("- **GRAV (Gravity Vector):** X, Y, Z")
+    add("\n### GPS Data\n")
+    add("GPS data is not in XYZ format:")
+    add("- **GPS5:** Latitude, Longitude, Altitude, 2D Speed, 3D Speed")
+    add("- **GPS9:** Latitude, Longitude, Altitude, 2D Speed, 3D Speed, Days since 2000, Seconds since midnight, DOP, Fix")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def main():
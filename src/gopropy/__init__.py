@@ -30,7 +30,12 @@ __all__ = [
 ]
 
 
-def load(filepath: str, model: Optional[str] = None) -> "GoProTelemetry":
+def load(
+    filepath: str,
+    model: Optional[str] = None,
+    cache: bool = False,
+    dtype: str = "float32",
+) -> "GoProTelemetry":
     """Load telemetry data from a GoPro MP4 file.
 
     Args:
@@ -38,6 +43,11 @@ def load(filepath: str, model: Optional[str] = None) -> "GoProTelemetry":
         model: GoPro model identifier (e.g., 'HERO10', 'HERO7_BLACK').
                If None, attempts to auto-detect from video metadata.
                Supported models: HERO5-HERO13 (Black/Session variants)
+        cache: If True, cache the extracted GPMF packets in a
+               ``<video>.gpmf.cache`` file next to the video so later loads
+               skip extraction. The cache is rebuilt when the video changes.
+        dtype: Floating-point dtype for scaled sensor data ('float32' or
+               'float64'). GPS streams always use float64.
 
     Returns:
         GoProTelemetry object with parsed sensor data
@@ -50,6 +60,9 @@ def load(filepath: str, model: Optional[str] = None) -> "GoProTelemetry":
         >>> # Manual model specification
         >>> telemetry = gopropy.load("GOPR0001.MP4", model="HERO10")
         >>>
+        >>> # Reuse extracted packets on subsequent loads
+        >>> telemetry = gopropy.load("GOPR0001.MP4", cache=True)
+        >>>
         >>> # Access sensor streams
         >>> df = telemetry.to_dataframe()
         >>> accel = telemetry.get_stream("ACCL")
@@ -57,4 +70,4 @@ def load(filepath: str, model: Optional[str] = None) -> "GoProTelemetry":
         >>> # List supported models
         >>> models = gopropy.list_supported_models()
     """
-    return GoProTelemetry.from_file(filepath, model=model)
+    return GoProTelemetry.from_file(filepath, model=model, cache=cache, dtype=dtype)
@@ -1,12 +1,44 @@
-"""Extract GPMF telemetry stream from GoPro MP4 files."""
-
+"""Extract GPMF telemetry stream from GoPro MP4 files.
+
+Packets are read with PyAV when it is installed (``pip install gopropy[av]``),
+which demuxes the GPMF track in-process. Otherwise the ffmpeg/ffprobe command
+line tools are used.
+
+Extracted packets can optionally be cached in a ``<video>.gpmf.cache`` sidecar
+file next to the video (e.g. ``GX010001.MP4.gpmf.cache``) so repeated loads skip
+demuxing entirely.
+"""
+
+import csv
+import logging
+import mmap
+import os
+import struct
 import subprocess
 import json
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Handler name GoPro writes on the GPMF metadata track
+GPMF_HANDLER_NAME = "GoPro MET"
+
+# Cache file layout: header (magic, packet count, size and mtime in ns of the
+# video it was extracted from), one index entry per packet (timestamp, payload
+# offset, payload size), then the concatenated payloads.
+CACHE_SUFFIX = ".gpmf.cache"
+_CACHE_MAGIC = b"GPMFCAC2"
+_CACHE_HEADER = struct.Struct("<8sQQq")
+_CACHE_ENTRY = struct.Struct("<dQQ")
 
+# Pipe buffer size when reading raw packets from ffmpeg
+RAW_READ_BUFFER_SIZE = 1 << 20
 
-def extract_gpmf_stream(filepath: str) -> List[Tuple[float, bytes]]:
+
+def extract_gpmf_stream(
+    filepath: str, cache: bool = False
+) -> List[Tuple[float, bytes]]:
     """Extract raw GPMF telemetry data from a GoPro MP4 file.
 
     This function locates the GPMF metadata track (codec_tag: gpmd) in the MP4
@@ -14,6 +46,9 @@ def extract_gpmf_stream(filepath: str) -> List[Tuple[float, bytes]]:
 
     Args:
         filepath: Path to the GoPro MP4 file
+        cache: If True, read packets from the ``.gpmf.cache`` sidecar file when
+               it was written for this exact video (same size and
+               modification time), and write it after extracting otherwise
 
     Returns:
         List of tuples (timestamp, raw_gpmf_data) where:
@@ -23,13 +58,45 @@ def extract_gpmf_stream(filepath: str) -> List[Tuple[float, bytes]]:
     Raises:
         FileNotFoundError: If the file doesn't exist
         ValueError: If no GPMF stream is found in the file
-        RuntimeError: If ffmpeg/ffprobe is not available
+        RuntimeError: If neither PyAV nor ffmpeg/ffprobe is available
     """
     filepath = Path(filepath)
     if not filepath.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
 
-    # First, identify the GPMF stream index
+    if not cache:
+        return _extract_packets(filepath)
+
+    # Keep the video's extension so e.g. a.MP4 and a.MOV get separate caches
+    cache_path = filepath.with_name(filepath.name + CACHE_SUFFIX)
+    video_stat = filepath.stat()
+    packets = _read_cache(cache_path, video_stat)
+    if packets is None:
+        packets = _extract_packets(filepath)
+        _write_cache(cache_path, packets, video_stat)
+    return packets
+
+
+def _extract_packets(filepath: Path) -> List[Tuple[float, bytes]]:
+    """Extract GPMF packets using PyAV, or ffmpeg/ffprobe as a fallback.
+
+    Args:
+        filepath: Path to the MP4 file
+
+    Returns:
+        List of (timestamp, raw_data) tuples
+    """
+    try:
+        import av  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        packets = _extract_with_pyav(filepath)
+        if packets is None:
+            raise ValueError(f"No GPMF telemetry stream found in {filepath}")
+        return packets
+
+    # Without PyAV, identify the GPMF stream index
     gpmf_stream_index = _find_gpmf_stream(filepath)
     if gpmf_stream_index is None:
         raise ValueError(f"No GPMF telemetry stream found in {filepath}")
@@ -38,6 +105,131 @@ def extract_gpmf_stream(filepath: str) -> List[Tuple[float, bytes]]:
     return _extract_raw_packets(filepath, gpmf_stream_index)
 
 
+def _read_cache(
+    cache_path: Path, video_stat: os.stat_result
+) -> Optional[List[Tuple[float, bytes]]]:
+    """Load packets from a cache file if it was written for this video.
+
+    GoPro reuses file names across cards, so the cache must record the exact
+    size and modification time of the video it was extracted from.
+
+    Args:
+        cache_path: Path to the ``.gpmf.cache`` file
+        video_stat: ``os.stat`` result of the source MP4 file
+
+    Returns:
+        List of (timestamp, raw_data) tuples, or None on a cache miss
+    """
+    try:
+        with (
+            open(cache_path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            magic, count, video_size, video_mtime_ns = _CACHE_HEADER.unpack_from(mm, 0)
+            if (
+                magic != _CACHE_MAGIC
+                or video_size != video_stat.st_size
+                or video_mtime_ns != video_stat.st_mtime_ns
+            ):
+                return None
+            index_end = _CACHE_HEADER.size + count * _CACHE_ENTRY.size
+            index = list(_CACHE_ENTRY.iter_unpack(mm[_CACHE_HEADER.size : index_end]))
+            # A truncated file means an interrupted write; re-extract instead
+            if index and index[-1][1] + index[-1][2] != len(mm):
+                return None
+            return [
+                (timestamp, mm[offset : offset + size])
+                for timestamp, offset, size in index
+            ]
+    except (OSError, ValueError, struct.error) as e:
+        logger.debug(f"Ignoring unreadable GPMF cache {cache_path}: {e}")
+        return None
+
+
+def _write_cache(
+    cache_path: Path,
+    packets: List[Tuple[float, bytes]],
+    video_stat: os.stat_result,
+):
+    """Write packets to a cache file.
+
+    Failures (e.g. a read-only media directory) are logged and ignored.
+
+    Args:
+        cache_path: Path to the ``.gpmf.cache`` file
+        packets: List of (timestamp, raw_data) tuples
+        video_stat: ``os.stat`` result of the video the packets came from
+    """
+    header = _CACHE_HEADER.pack(
+        _CACHE_MAGIC, len(packets), video_stat.st_size, video_stat.st_mtime_ns
+    )
+    offset = _CACHE_HEADER.size + len(packets) * _CACHE_ENTRY.size
+    index = []
+    for timestamp, data in packets:
+        index.append(_CACHE_ENTRY.pack(timestamp, offset, len(data)))
+        offset += len(data)
+
+    # Write to a temporary file first so readers never see a partial cache
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join([header, *index, *(data for _, data in packets)]))
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write GPMF cache {cache_path}: {e}")
+
+
+def _extract_with_pyav(filepath: Path) -> Optional[List[Tuple[float, bytes]]]:
+    """Demux GPMF packets with PyAV in a single pass over the container.
+
+    The file is memory-mapped and handed to PyAV as a file object, so the
+    many small seeks into the moov atom and sample tables are served from the
+    page cache instead of separate read calls.
+
+    Args:
+        filepath: Path to the MP4 file
+
+    Returns:
+        List of (timestamp, raw_data) tuples, or None if no GPMF track exists
+    """
+    import av
+
+    try:
+        with (
+            open(filepath, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            av.open(mm) as container,
+        ):
+            stream = next((s for s in container.streams if _is_gpmf_stream(s)), None)
+            if stream is None:
+                return None
+
+            time_base = float(stream.time_base)
+            return [
+                (packet.pts * time_base, bytes(packet))
+                for packet in container.demux(stream)
+                if packet.pts is not None and packet.size
+            ]
+    except (av.FFmpegError, ValueError) as e:
+        # mmap raises ValueError for empty files
+        raise RuntimeError(f"PyAV failed to read {filepath}: {e}")
+
+
+def _is_gpmf_stream(stream) -> bool:
+    """Check whether a PyAV stream is the GPMF metadata track.
+
+    Recent PyAV releases do not expose codec tags on data streams, so the
+    track is matched on its handler name and the codec tag is only checked
+    when available.
+    """
+    if stream.type != "data":
+        return False
+    if GPMF_HANDLER_NAME in stream.metadata.get("handler_name", ""):
+        return True
+    codec_context = getattr(stream, "codec_context", None)
+    return getattr(codec_context, "codec_tag", None) == "gpmd"
+
+
 def _find_gpmf_stream(filepath: Path) -> int | None:
     """Find the stream index of the GPMF metadata track.
 
@@ -98,8 +290,8 @@ def _extract_raw_packets(
         return []
 
     try:
-        # Extract raw binary data
-        result = subprocess.run(
+        # Stream raw binary data so packets are sliced as they are read
+        proc = subprocess.Popen(
             [
                 "ffmpeg",
                 "-v",
@@ -114,28 +306,31 @@ def _extract_raw_packets(
                 "rawvideo",
                 "-",
             ],
-            capture_output=True,
-            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=RAW_READ_BUFFER_SIZE,
         )
     except FileNotFoundError:
         raise RuntimeError(
             "ffmpeg not found. Please install ffmpeg: https://ffmpeg.org/download.html"
         )
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"ffmpeg extraction failed: {e.stderr.decode()}")
-
-    raw_data = result.stdout
 
     # Split the raw data based on packet sizes
     packets = []
-    offset = 0
+    with proc:
+        for timestamp, size in packet_info:
+            packet_data = proc.stdout.read(size)
+            if len(packet_data) < size:
+                break
+            packets.append((timestamp, packet_data))
 
-    for timestamp, size in packet_info:
-        if offset + size > len(raw_data):
-            break
-        packet_data = raw_data[offset : offset + size]
-        packets.append((timestamp, packet_data))
-        offset += size
+        # Drain anything left so ffmpeg can exit cleanly
+        while proc.stdout.read(RAW_READ_BUFFER_SIZE):
+            pass
+        stderr = proc.stderr.read()
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg extraction failed: {stderr.decode()}")
 
     return packets
 
@@ -143,6 +338,9 @@ def _extract_raw_packets(
 def _extract_packet_info(filepath: Path, stream_index: int) -> List[Tuple[float, int]]:
     """Extract timestamp and size for each packet in the GPMF stream.
 
+    Only the two needed fields are requested from ffprobe, as headerless CSV
+    rows that are parsed while ffprobe is still writing them.
+
     Args:
         filepath: Path to the MP4 file
         stream_index: Index of the GPMF stream
@@ -151,32 +349,40 @@ def _extract_packet_info(filepath: Path, stream_index: int) -> List[Tuple[float,
         List of (timestamp, size) tuples
     """
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [
                 "ffprobe",
                 "-v",
                 "quiet",
-                "-print_format",
-                "json",
-                "-show_packets",
                 "-select_streams",
                 str(stream_index),
+                "-show_entries",
+                "packet=pts_time,size",
+                "-print_format",
+                "csv=print_section=0",
                 str(filepath),
             ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=True,
         )
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"ffprobe packet info extraction failed: {e.stderr}")
+    except FileNotFoundError:
+        raise RuntimeError(
+            "ffprobe not found. Please install ffmpeg: https://ffmpeg.org/download.html"
+        )
 
-    data = json.loads(result.stdout)
     packet_info = []
-
-    for packet in data.get("packets", []):
-        pts_time = packet.get("pts_time")
-        size = packet.get("size")
-        if pts_time and size:
-            packet_info.append((float(pts_time), int(size)))
+    with proc:
+        # ffprobe writes fields in its own order: pts_time, then size
+        for row in csv.reader(proc.stdout):
+            if len(row) < 2:
+                continue
+            pts_time, size = row[0], row[1]
+            if pts_time and pts_time != "N/A" and size:
+                packet_info.append((float(pts_time), int(size)))
+        stderr = proc.stderr.read()
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffprobe packet info extraction failed: {stderr}")
 
     return packet_info
@@ -8,17 +8,23 @@ Each model inherits from its predecessor and adds/removes FourCC codes
 and metadata capabilities.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import AbstractSet, Dict, List, Optional
 import logging
+import re
+
+from .parser import iter_samples
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Configuration for a specific GoPro model.
 
+    Configs are immutable; resolved configs are shared between all callers.
+
     Attributes:
         name: Internal model identifier (e.g., "HERO10_BLACK")
         display_name: Human-readable model name
@@ -42,13 +48,13 @@ class ModelConfig:
     axis_order: Dict[str, List[str]] = field(default_factory=dict)
 
     # FourCC codes supported by this model
-    supported_fourccs: Set[str] = field(default_factory=set)
+    supported_fourccs: AbstractSet[str] = field(default_factory=set)
 
     # FourCC codes added in this model (relative to previous)
-    added_fourccs: Set[str] = field(default_factory=set)
+    added_fourccs: AbstractSet[str] = field(default_factory=set)
 
     # FourCC codes removed in this model
-    removed_fourccs: Set[str] = field(default_factory=set)
+    removed_fourccs: AbstractSet[str] = field(default_factory=set)
 
     # FourCC codes with changed behavior
     changed_fourccs: Dict[str, str] = field(default_factory=dict)
@@ -363,63 +369,136 @@ MODEL_ALIASES = {
 }
 
 
+# Model number (and Session suffix) in a DVNM device name such as
+# "HERO10 Black" or "Hero 5 Session", compiled once so detection is one scan
+_DEVICE_NAME_PATTERN = re.compile(r"hero\s*(\d+)(.*session)?", re.IGNORECASE)
+_DEVICE_NUMBER_MODELS = {
+    5: "HERO5_BLACK",
+    6: "HERO6_BLACK",
+    7: "HERO7_BLACK",
+    8: "HERO8_BLACK",
+    9: "HERO9_BLACK",
+    10: "HERO10_BLACK",
+    11: "HERO11_BLACK",
+    12: "HERO12_BLACK",
+    13: "HERO13_BLACK",
+}
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
 
-def build_model_config(model_name: str) -> ModelConfig:
-    """Build complete model config including inherited features.
+def _resolve_model(config: ModelConfig, parent: Optional[ModelConfig]) -> ModelConfig:
+    """Merge a base config with its already-resolved parent.
 
     Args:
-        model_name: Model identifier (e.g., "HERO10_BLACK")
+        config: Model config from GOPRO_MODELS_BASE
+        parent: Resolved parent config, or None for a base model
 
     Returns:
-        Complete ModelConfig with all inherited features
+        New ModelConfig with frozen FourCC sets and inherited axis order
     """
-    if model_name not in GOPRO_MODELS_BASE:
-        logger.warning(f"Unknown model '{model_name}', using GENERIC config")
-        model_name = "GENERIC"
-
-    config = GOPRO_MODELS_BASE[model_name]
-
-    # Create a copy to avoid modifying the base config
-    built_config = ModelConfig(
-        name=config.name,
-        display_name=config.display_name,
-        firmware_version=config.firmware_version,
-        release_year=config.release_year,
-        axis_order=config.axis_order.copy() if config.axis_order else {},
-        supported_fourccs=config.supported_fourccs.copy()
-        if config.supported_fourccs
-        else set(),
-        added_fourccs=config.added_fourccs.copy() if config.added_fourccs else set(),
-        removed_fourccs=config.removed_fourccs.copy()
-        if config.removed_fourccs
-        else set(),
-        changed_fourccs=config.changed_fourccs.copy() if config.changed_fourccs else {},
-        notes=config.notes,
-        inherits_from=config.inherits_from,
+    axis_order = dict(config.axis_order)
+    added_fourccs = frozenset(config.added_fourccs)
+    removed_fourccs = frozenset(config.removed_fourccs)
+    if parent is None:
+        # Base model - supported_fourccs is already complete
+        supported_fourccs = frozenset(config.supported_fourccs)
+    else:
+        supported_fourccs = (parent.supported_fourccs | added_fourccs) - removed_fourccs
+        # Inherit axis_order where not overridden
+        for fourcc, axes in parent.axis_order.items():
+            axis_order.setdefault(fourcc, axes)
+
+    return replace(
+        config,
+        axis_order=axis_order,
+        supported_fourccs=supported_fourccs,
+        added_fourccs=added_fourccs,
+        removed_fourccs=removed_fourccs,
+        changed_fourccs=dict(config.changed_fourccs),
     )
 
-    # Build inheritance chain
-    if config.inherits_from:
-        parent = build_model_config(config.inherits_from)
 
-        # Merge supported FourCC codes
-        built_config.supported_fourccs = (
-            parent.supported_fourccs | built_config.added_fourccs
-        ) - built_config.removed_fourccs
+def _resolve_models(models: Dict[str, ModelConfig]) -> Dict[str, ModelConfig]:
+    """Resolve inheritance for every model in one pass, parents first.
 
-        # Inherit axis_order where not overridden
-        for fourcc, axes in parent.axis_order.items():
-            if fourcc not in built_config.axis_order:
-                built_config.axis_order[fourcc] = axes
-    else:
-        # Base model - supported_fourccs is already complete
-        pass
+    Args:
+        models: Base model configs keyed by name
+
+    Returns:
+        Dict of fully resolved configs keyed by name
+
+    Raises:
+        ValueError: If a model inherits from an unknown model or a cycle exists
+    """
+    resolved: Dict[str, ModelConfig] = {}
+    for name in models:
+        # Walk up to the nearest resolved ancestor, then resolve back down
+        chain = []
+        current = name
+        while current is not None and current not in resolved:
+            if current in chain:
+                raise ValueError(f"Inheritance cycle involving model '{current}'")
+            if current not in models:
+                raise ValueError(
+                    f"Model '{chain[-1]}' inherits from unknown '{current}'"
+                )
+            chain.append(current)
+            current = models[current].inherits_from
+
+        for current in reversed(chain):
+            config = models[current]
+            parent = resolved[config.inherits_from] if config.inherits_from else None
+            resolved[current] = _resolve_model(config, parent)
+
+    return resolved
+
+
+# Fully resolved configs, built once at import
+GOPRO_MODELS_RESOLVED = _resolve_models(GOPRO_MODELS_BASE)
+
+# Resolved configs keyed by model name and by alias
+_CONFIGS_BY_NAME = {
+    **GOPRO_MODELS_RESOLVED,
+    **{alias: GOPRO_MODELS_RESOLVED[name] for alias, name in MODEL_ALIASES.items()},
+}
+
+_SUPPORTED_MODEL_NAMES = tuple(
+    sorted(name for name in GOPRO_MODELS_BASE if name != "GENERIC")
+)
+
+
+def build_model_config(model_name: str) -> ModelConfig:
+    """Build complete model config including inherited features.
 
-    return built_config
+    Configs are resolved once at import, so the returned config is shared
+    between callers and should not be modified.
+
+    Args:
+        model_name: Model identifier (e.g., "HERO10_BLACK")
+
+    Returns:
+        Complete ModelConfig with all inherited features
+    """
+    config = GOPRO_MODELS_RESOLVED.get(model_name)
+    if config is None:
+        logger.warning(f"Unknown model '{model_name}', using GENERIC config")
+        config = GOPRO_MODELS_RESOLVED["GENERIC"]
+    return config
+
+
+def _model_from_device_name(device_name: str) -> Optional[str]:
+    """Map a DVNM device name to a model identifier, if it names one."""
+    match = _DEVICE_NAME_PATTERN.search(device_name)
+    if match:
+        number = int(match.group(1))
+        if number == 5 and match.group(2):
+            return "HERO5_SESSION"
+        return _DEVICE_NUMBER_MODELS.get(number)
+    return None
 
 
 def detect_model_from_metadata(gpmf_samples: List) -> Optional[str]:
@@ -427,8 +506,10 @@ def detect_model_from_metadata(gpmf_samples: List) -> Optional[str]:
 
     Attempts to identify the camera model using:
     1. DVNM (Device Name) field
-    2. Firmware version (FIRM field)
-    3. FourCC signature matching (presence of specific codes)
+    2. FourCC signature matching (presence of specific codes)
+
+    The scan stops at the first device name that identifies a model, so
+    the FourCC signature is only collected when no name matches.
 
     Args:
         gpmf_samples: List of parsed GPMF samples
@@ -436,50 +517,16 @@ def detect_model_from_metadata(gpmf_samples: List) -> Optional[str]:
     Returns:
         Model identifier string (e.g., "HERO10_BLACK") or None if unknown
     """
-    device_name = None
-    firmware = None
     available_fourccs = set()
 
-    # Extract metadata
-    def extract_from_samples(samples):
-        nonlocal device_name, firmware
-        for sample in samples:
-            if sample.fourcc == "DVNM":
-                device_name = sample.data
-            elif sample.fourcc == "FIRM":
-                firmware = sample.data
-            available_fourccs.add(sample.fourcc)
-
-            # Recursively check nested structures
-            if sample.type_code == "\0" and isinstance(sample.data, list):
-                extract_from_samples(sample.data)
-
-    extract_from_samples(gpmf_samples)
-
-    # Priority 1: Direct device name matching
-    if device_name:
-        device_name_lower = device_name.lower()
-
-        if "hero13" in device_name_lower or "hero 13" in device_name_lower:
-            return "HERO13_BLACK"
-        elif "hero12" in device_name_lower or "hero 12" in device_name_lower:
-            return "HERO12_BLACK"
-        elif "hero11" in device_name_lower or "hero 11" in device_name_lower:
-            return "HERO11_BLACK"
-        elif "hero10" in device_name_lower or "hero 10" in device_name_lower:
-            return "HERO10_BLACK"
-        elif "hero9" in device_name_lower or "hero 9" in device_name_lower:
-            return "HERO9_BLACK"
-        elif "hero8" in device_name_lower or "hero 8" in device_name_lower:
-            return "HERO8_BLACK"
-        elif "hero7" in device_name_lower or "hero 7" in device_name_lower:
-            return "HERO7_BLACK"
-        elif "hero6" in device_name_lower or "hero 6" in device_name_lower:
-            return "HERO6_BLACK"
-        elif "hero5" in device_name_lower or "hero 5" in device_name_lower:
-            if "session" in device_name_lower:
-                return "HERO5_SESSION"
-            return "HERO5_BLACK"
+    # Scan metadata, including nested structures
+    for sample in iter_samples(gpmf_samples):
+        # Priority 1: Direct device name matching
+        if sample.fourcc == "DVNM" and isinstance(sample.data, str):
+            model_name = _model_from_device_name(sample.data)
+            if model_name:
+                return model_name
+        available_fourccs.add(sample.fourcc)
 
     # Priority 2: FourCC signature matching
     # Check for presence of model-specific FourCC codes
@@ -509,6 +556,8 @@ def detect_model_from_metadata(gpmf_samples: List) -> Optional[str]:
 def get_model_config(model_name: Optional[str] = None) -> ModelConfig:
     """Get model configuration, resolving aliases and building inheritance.
 
+    The returned config is shared between callers and should not be modified.
+
     Args:
         model_name: Model identifier, alias, or None for GENERIC
 
@@ -516,14 +565,12 @@ def get_model_config(model_name: Optional[str] = None) -> ModelConfig:
         Complete ModelConfig
     """
     if model_name is None:
-        return build_model_config("GENERIC")
+        return GOPRO_MODELS_RESOLVED["GENERIC"]
 
-    # Resolve alias
-    model_name = model_name.upper()
-    if model_name in MODEL_ALIASES:
-        model_name = MODEL_ALIASES[model_name]
-
-    return build_model_config(model_name)
+    config = _CONFIGS_BY_NAME.get(model_name.upper())
+    if config is None:
+        return build_model_config(model_name.upper())
+    return config
 
 
 def list_supported_models() -> List[str]:
@@ -532,7 +579,7 @@ def list_supported_models() -> List[str]:
     Returns:
         List of model names
     """
-    return sorted([name for name in GOPRO_MODELS_BASE.keys() if name != "GENERIC"])
+    return list(_SUPPORTED_MODEL_NAMES)
 
 
 def get_model_info(model_name: str) -> Dict:
@@ -544,6 +591,16 @@ def get_model_info(model_name: str) -> Dict:
     Returns:
         Dict with model information
     """
+    return dict(_model_info(model_name))
+
+
+@lru_cache(maxsize=64)
+def _model_info(model_name: str) -> Dict:
+    """Cached model information; callers receive a copy.
+
+    The cache is bounded because model names may come from device names in
+    arbitrary files.
+    """
     config = get_model_config(model_name)
     return {
         "name": config.name,
@@ -4,9 +4,13 @@ GPMF uses a Key-Length-Value (KLV) structure with 32-bit alignment.
 """
 
 import struct
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from enum import Enum
+from types import MappingProxyType
+
+import numpy as np
 
 
 class GPMFType(Enum):
@@ -28,30 +32,62 @@ class GPMFType(Enum):
     NESTED = ord("\0")  # Nested structure
 
 
-@dataclass
+# Marks a sample whose payload has not been decoded yet
+_UNDECODED = object()
+
+
+@dataclass(slots=True)
 class GPMFSample:
-    """Represents a single GPMF KLV sample."""
+    """Represents a single GPMF KLV sample.
+
+    The payload is decoded on first access to ``data`` and cached, so
+    samples that are never read cost only their header.
+    """
 
     fourcc: str  # 4-character key
     type_code: str  # Single character type
     structure_size: int  # Size of each sample element
     repeat_count: int  # Number of repeated samples
-    data: Any  # Parsed data
-    raw_data: bytes  # Raw binary data
+    # Raw binary data (view into the parsed packet)
+    raw_data: memoryview = field(repr=False)
+    _parser: Optional["GPMFParser"] = field(default=None, repr=False, compare=False)
+    _data: Any = field(default=_UNDECODED, init=False, repr=False, compare=False)
+
+    @property
+    def data(self) -> Any:
+        """Parsed data (numeric samples are NumPy arrays)."""
+        if self._data is _UNDECODED:
+            parser = self._parser if self._parser is not None else GPMFParser()
+            self._data = parser._parse_data(
+                self.raw_data, self.type_code, self.structure_size, self.repeat_count
+            )
+        return self._data
+
+    def __reduce__(self):
+        # memoryviews cannot be pickled; the payload is copied out as bytes
+        # and decoded again on first access after unpickling
+        return (
+            _restore_sample,
+            (
+                self.fourcc,
+                self.type_code,
+                self.structure_size,
+                self.repeat_count,
+                bytes(self.raw_data),
+            ),
+        )
 
 
-class GPMFParser:
-    """Parser for GPMF binary format.
+def _restore_sample(
+    fourcc: str, type_code: str, structure_size: int, repeat_count: int, raw: bytes
+) -> GPMFSample:
+    """Rebuild a pickled GPMFSample around a view of its payload bytes."""
+    return GPMFSample(fourcc, type_code, structure_size, repeat_count, memoryview(raw))
 
-    The GPMF format uses a modified Key-Length-Value structure:
-    - Key: 4-byte FourCC (7-bit ASCII)
-    - Type: 1 byte (type code)
-    - Size: 1 byte (size of structure in bytes)
-    - Repeat: 2 bytes (number of samples)
-    - Data: Variable length, 32-bit aligned
-    """
 
-    TYPE_SIZES = {
+# Size in bytes of each GPMF type code
+TYPE_SIZES = MappingProxyType(
+    {
         "b": 1,
         "B": 1,  # bytes
         "s": 2,
@@ -67,6 +103,187 @@ class GPMFParser:
         "?": 0,  # Complex (variable)
         "\0": 0,  # Nested
     }
+)
+
+# NumPy dtypes for numeric type codes (GPMF values are big-endian)
+NUMPY_DTYPES = MappingProxyType(
+    {
+        "b": np.dtype("i1"),  # signed byte
+        "B": np.dtype("u1"),  # unsigned byte
+        "s": np.dtype(">i2"),  # signed short
+        "S": np.dtype(">u2"),  # unsigned short
+        "l": np.dtype(">i4"),  # signed long (32-bit int)
+        "L": np.dtype(">u4"),  # unsigned long (32-bit int)
+        "f": np.dtype(">f4"),  # float
+        "d": np.dtype(">f8"),  # double
+    }
+)
+
+# Precompiled structs for single-value numeric entries
+_SCALAR_STRUCTS = MappingProxyType(
+    {
+        type_code: struct.Struct(">" + dtype.char)
+        for type_code, dtype in NUMPY_DTYPES.items()
+    }
+)
+
+# KLV header: FourCC key, type code, structure size, repeat count
+_HEADER = struct.Struct(">4sBBH")
+
+
+# Primary sensor data FourCCs (the main data streams we want)
+PRIMARY_FOURCCS = frozenset(
+    {
+        "ACCL",
+        "GYRO",
+        "GPS5",
+        "MAGN",
+        "SHUT",
+        "WBAL",
+        "WRGB",
+        "ISOE",
+        "YAVG",
+        "UNIF",
+        "CORI",
+    }
+)
+
+# All known sensor/metadata FourCC codes
+SENSOR_FOURCCS = PRIMARY_FOURCCS | {
+    "GPSF",
+    "GPSU",
+    "GPSP",
+    "FACE",
+    "FCNM",
+    "ISOG",
+    "AALP",
+    "MWET",
+    "WNDM",
+    "MTRX",
+    "ORIN",
+    "ORIO",
+    "GRAV",
+    "IORI",
+    "SCEN",
+    "SROT",
+}
+
+# Stream metadata FourCCs and the stream field each one sets
+STREAM_METADATA_FIELDS = MappingProxyType(
+    {
+        "STNM": "name",
+        "SIUN": "units",
+        "SCAL": "scale",
+    }
+)
+
+
+# Type code string for each header type byte, indexed by the byte value
+_TYPE_CODES = tuple(chr(type_byte) for type_byte in range(256))
+
+# Decoded FourCC keys. Files use a few dozen distinct keys, so each is decoded
+# and interned once; the size cap only guards against corrupt data.
+_FOURCC_CACHE: Dict[bytes, str] = {}
+_FOURCC_CACHE_MAX = 1024
+
+
+def _decode_fourcc(key: bytes) -> str:
+    """Decode and intern a FourCC key, caching the result."""
+    fourcc = sys.intern(key.decode("ascii", errors="replace"))
+    if len(_FOURCC_CACHE) < _FOURCC_CACHE_MAX:
+        _FOURCC_CACHE[key] = fourcc
+    return fourcc
+
+
+def _walk_klv(
+    data: memoryview, offset: int = 0
+) -> Iterator[Tuple[str, str, int, int, int, int]]:
+    """Walk the KLV headers at one nesting level without decoding payloads.
+
+    Stops at zero padding or at an entry that runs past the end of the data.
+
+    Args:
+        data: View of raw GPMF binary data
+        offset: Starting offset in the data
+
+    Yields:
+        Tuples of (fourcc, type_code, structure_size, repeat_count,
+        data_offset, data_size) for each entry
+    """
+    end = len(data) - 8  # Need at least 8 bytes for header
+    pos = offset
+    while pos < end:
+        key, type_byte, structure_size, repeat_count = _HEADER.unpack_from(data, pos)
+
+        # Check if we've hit padding (null bytes)
+        if key == b"\x00\x00\x00\x00":
+            return
+
+        data_size = structure_size * repeat_count
+
+        # Data is 32-bit aligned: header (8 bytes) + data rounded up to 4
+        next_pos = pos + 8 + ((data_size + 3) & ~3)
+        if next_pos > end + 8:
+            return
+
+        fourcc = _FOURCC_CACHE.get(key)
+        if fourcc is None:
+            fourcc = _decode_fourcc(key)
+
+        yield (
+            fourcc,
+            _TYPE_CODES[type_byte],
+            structure_size,
+            repeat_count,
+            pos + 8,
+            data_size,
+        )
+        pos = next_pos
+
+
+def iter_samples(samples: List[GPMFSample]) -> Iterator[GPMFSample]:
+    """Iterate over samples and all nested samples, depth first.
+
+    Each sample is yielded before its nested samples, in file order. Uses an
+    explicit stack, so deeply nested data cannot hit the recursion limit.
+
+    Args:
+        samples: List of parsed GPMF samples
+
+    Yields:
+        Every sample in the tree
+    """
+    stack = [iter(samples)]
+    while stack:
+        for sample in stack[-1]:
+            yield sample
+            if sample.type_code == "\0" and isinstance(sample.data, list):
+                # Descend, then resume this level once the children are done
+                stack.append(iter(sample.data))
+                break
+        else:
+            stack.pop()
+
+
+def _decode_tree(sample: GPMFSample):
+    """Decode the payload of a sample and of all its nested samples."""
+    for nested in iter_samples([sample]):
+        _ = nested.data  # Property access decodes and caches the payload
+
+
+class GPMFParser:
+    """Parser for GPMF binary format.
+
+    The GPMF format uses a modified Key-Length-Value structure:
+    - Key: 4-byte FourCC (7-bit ASCII)
+    - Type: 1 byte (type code)
+    - Size: 1 byte (size of structure in bytes)
+    - Repeat: 2 bytes (number of samples)
+    - Data: Variable length, 32-bit aligned
+    """
+
+    # Size in bytes of each type code (see the module-level TYPE_SIZES)
+    TYPE_SIZES = TYPE_SIZES
 
     def __init__(self):
         self.samples: List[GPMFSample] = []
@@ -75,79 +292,69 @@ class GPMFParser:
     def parse(self, data: bytes, offset: int = 0) -> List[GPMFSample]:
         """Parse GPMF binary data into structured samples.
 
+        Payloads are sliced from a memoryview of ``data``, so nested
+        structures and ``raw_data`` share the packet's buffer instead of
+        copying it. Payloads are only decoded when a sample's ``data`` is
+        first read.
+
         Args:
-            data: Raw GPMF binary data
+            data: Raw GPMF binary data (bytes or any buffer)
             offset: Starting offset in the data
 
         Returns:
             List of parsed GPMF samples
         """
+        data = memoryview(data)
         samples = []
-        pos = offset
-
-        while pos < len(data) - 8:  # Need at least 8 bytes for header
-            # Check if we've hit padding (null bytes)
-            if data[pos : pos + 4] == b"\x00\x00\x00\x00":
-                break
-
-            sample = self._parse_sample(data, pos)
-            if sample is None:
-                break
-
-            samples.append(sample)
-
-            # Calculate next position (data is 32-bit aligned)
-            data_size = sample.structure_size * sample.repeat_count
-            aligned_size = (data_size + 3) & ~3  # Round up to multiple of 4
-            pos += 8 + aligned_size  # Header (8 bytes) + aligned data
+        for (
+            fourcc,
+            type_code,
+            structure_size,
+            repeat_count,
+            start,
+            data_size,
+        ) in _walk_klv(data, offset):
+            samples.append(
+                GPMFSample(
+                    fourcc=fourcc,
+                    type_code=type_code,
+                    structure_size=structure_size,
+                    repeat_count=repeat_count,
+                    raw_data=data[start : start + data_size],
+                    _parser=self,
+                )
+            )
 
         return samples
 
-    def _parse_sample(self, data: bytes, offset: int) -> Optional[GPMFSample]:
-        """Parse a single GPMF KLV sample.
+    def parse_parallel(
+        self, data: bytes, max_workers: Optional[int] = None
+    ) -> List[GPMFSample]:
+        """Parse GPMF data, decoding top-level blocks on a thread pool.
+
+        Top-level DEVC blocks cover independent byte ranges, so their
+        payloads are decoded concurrently. Unlike :meth:`parse`, every
+        payload is decoded before this returns.
 
         Args:
-            data: Raw GPMF data
-            offset: Starting offset of the sample
+            data: Raw GPMF binary data
+            max_workers: Maximum number of threads (default: the
+                         ThreadPoolExecutor default)
 
         Returns:
-            Parsed GPMFSample or None if invalid
+            List of parsed GPMF samples, in file order
         """
-        if offset + 8 > len(data):
-            return None
-
-        # Parse header (8 bytes)
-        fourcc = data[offset : offset + 4].decode("ascii", errors="replace")
-        type_code = chr(data[offset + 4])
-        structure_size = data[offset + 5]
-        repeat_count = struct.unpack(">H", data[offset + 6 : offset + 8])[0]
-
-        # Calculate data size and extract raw data
-        data_size = structure_size * repeat_count
-        aligned_size = (data_size + 3) & ~3
-
-        if offset + 8 + aligned_size > len(data):
-            return None
-
-        raw_data = data[offset + 8 : offset + 8 + data_size]
-
-        # Parse the actual data based on type
-        parsed_data = self._parse_data(
-            raw_data, type_code, structure_size, repeat_count
-        )
+        from concurrent.futures import ThreadPoolExecutor
 
-        return GPMFSample(
-            fourcc=fourcc,
-            type_code=type_code,
-            structure_size=structure_size,
-            repeat_count=repeat_count,
-            data=parsed_data,
-            raw_data=raw_data,
-        )
+        samples = self.parse(data)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results so decoding errors are raised here
+            list(executor.map(_decode_tree, samples))
+        return samples
 
     def _parse_data(
         self,
-        data: bytes,
+        data: memoryview,
         type_code: str,
         structure_size: int,
         repeat_count: int,
@@ -155,13 +362,15 @@ class GPMFParser:
         """Parse the data portion of a GPMF sample.
 
         Args:
-            data: Raw data bytes
+            data: Raw data view
             type_code: GPMF type code
             structure_size: Size of each sample structure
             repeat_count: Number of repeated samples
 
         Returns:
-            Parsed data (type depends on type_code)
+            Parsed data (type depends on type_code). Numeric data is a NumPy
+            array of shape (repeat_count, elements) or (repeat_count,) for
+            single-element samples, or a Python scalar for a single value.
         """
         # Handle nested structures
         if type_code == "\0":
@@ -169,65 +378,39 @@ class GPMFParser:
 
         # Handle ASCII strings
         if type_code == "c":
-            return data.decode("ascii", errors="replace").rstrip("\x00")
+            return str(data, "ascii", errors="replace").rstrip("\x00")
 
         # Handle FourCC
         if type_code == "F":
             fourccs = []
             for i in range(repeat_count):
-                fourcc = data[i * 4 : (i + 1) * 4].decode("ascii", errors="replace")
+                fourcc = str(data[i * 4 : (i + 1) * 4], "ascii", errors="replace")
                 fourccs.append(fourcc)
             return fourccs if repeat_count > 1 else fourccs[0]
 
         # Handle numeric types
-        format_char = self._get_format_char(type_code)
-        if format_char is None:
-            return data  # Return raw data for unknown types
-
-        element_size = struct.calcsize(f">{format_char}")
-        elements_per_sample = structure_size // element_size
-
-        values = []
-        offset = 0
-
-        for _ in range(repeat_count):
-            sample_values = []
-            for _ in range(elements_per_sample):
-                value = struct.unpack(
-                    f">{format_char}", data[offset : offset + element_size]
-                )[0]
-                sample_values.append(value)
-                offset += element_size
-
-            # If only one element per sample, unwrap the list
-            if elements_per_sample == 1:
-                values.append(sample_values[0])
-            else:
-                values.append(tuple(sample_values))
+        dtype = NUMPY_DTYPES.get(type_code)
+        if dtype is None:
+            return bytes(data)  # Return raw data for unknown types
 
-        # If only one sample, unwrap the list
-        return values if repeat_count > 1 else values[0] if values else None
+        elements_per_sample = structure_size // dtype.itemsize
+        if repeat_count == 0:
+            return None
 
-    def _get_format_char(self, type_code: str) -> Optional[str]:
-        """Get struct format character for a GPMF type code.
+        # A single value is returned as a Python scalar (e.g. DVID, SCAL).
+        # These dominate header traffic, so skip NumPy for them.
+        if repeat_count == 1 and elements_per_sample == 1:
+            return _SCALAR_STRUCTS[type_code].unpack_from(data)[0]
 
-        Args:
-            type_code: GPMF type code
+        # Decode big-endian values in one pass and convert to native byte order
+        values = np.frombuffer(
+            data, dtype=dtype, count=repeat_count * elements_per_sample
+        ).astype(dtype.newbyteorder("="))
 
-        Returns:
-            struct format character or None
-        """
-        mapping = {
-            "b": "b",  # signed byte
-            "B": "B",  # unsigned byte
-            "s": "h",  # signed short
-            "S": "H",  # unsigned short
-            "l": "i",  # signed long (32-bit int)
-            "L": "I",  # unsigned long (32-bit int)
-            "f": "f",  # float
-            "d": "d",  # double
-        }
-        return mapping.get(type_code)
+        # Multi-element samples are (samples, elements); scalar samples are 1-D
+        if elements_per_sample == 1:
+            return values
+        return values.reshape(repeat_count, elements_per_sample)
 
     def find_samples(self, samples: List[GPMFSample], fourcc: str) -> List[GPMFSample]:
         """Find all samples with a specific FourCC key.
@@ -239,14 +422,7 @@ class GPMFParser:
         Returns:
             List of matching samples
         """
-        matches = []
-        for sample in samples:
-            if sample.fourcc == fourcc:
-                matches.append(sample)
-            # Recursively search nested structures
-            if sample.type_code == "\0" and isinstance(sample.data, list):
-                matches.extend(self.find_samples(sample.data, fourcc))
-        return matches
+        return [sample for sample in iter_samples(samples) if sample.fourcc == fourcc]
 
     def get_device_streams(
         self, samples: List[GPMFSample]
@@ -314,58 +490,25 @@ class GPMFParser:
             "fourcc": None,
         }
 
-        # Primary sensor data FourCCs (the main data streams we want)
-        primary_fourccs = {
-            "ACCL",
-            "GYRO",
-            "GPS5",
-            "MAGN",
-            "SHUT",
-            "WBAL",
-            "WRGB",
-            "ISOE",
-            "YAVG",
-            "UNIF",
-            "CORI",
-        }
-
-        # All known sensor/metadata FourCC codes
-        sensor_fourccs = primary_fourccs | {
-            "GPSF",
-            "GPSU",
-            "GPSP",
-            "FACE",
-            "FCNM",
-            "ISOG",
-            "AALP",
-            "MWET",
-            "WNDM",
-            "MTRX",
-            "ORIN",
-            "ORIO",
-            "GRAV",
-            "IORI",
-            "SCEN",
-            "SROT",
-        }
-
         for sample in stream_samples:
-            if sample.fourcc == "STNM":
-                stream["name"] = sample.data
-            elif sample.fourcc == "SIUN":
-                stream["units"] = sample.data
-            elif sample.fourcc == "SCAL":
-                stream["scale"] = sample.data
-            elif sample.fourcc in sensor_fourccs:
+            fourcc = sample.fourcc
+            field_name = STREAM_METADATA_FIELDS.get(fourcc)
+            if field_name is not None:
+                value = sample.data
+                # Per-axis scales are kept as a plain list
+                if isinstance(value, np.ndarray):
+                    value = value.ravel().tolist()
+                stream[field_name] = value
+            elif fourcc in SENSOR_FOURCCS:
                 # Prioritize primary data FourCCs over metadata
-                if sample.fourcc in primary_fourccs:
-                    if not stream["fourcc"] or stream["fourcc"] not in primary_fourccs:
-                        stream["fourcc"] = sample.fourcc
+                if fourcc in PRIMARY_FOURCCS:
+                    if not stream["fourcc"] or stream["fourcc"] not in PRIMARY_FOURCCS:
+                        stream["fourcc"] = fourcc
                 elif not stream["fourcc"]:
-                    stream["fourcc"] = sample.fourcc
+                    stream["fourcc"] = fourcc
 
                 if not stream["name"]:
-                    stream["name"] = sample.fourcc
+                    stream["name"] = fourcc
                 stream["data"].append(sample)
 
         return stream if stream["name"] else {}
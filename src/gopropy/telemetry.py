@@ -3,9 +3,10 @@
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
 import logging
+import sys
 
 from .extractor import extract_gpmf_stream
 from .parser import GPMFParser
@@ -13,6 +14,44 @@ from .models import ModelConfig, get_model_config, detect_model_from_metadata
 from .exceptions import StreamNotFoundError
 logger = logging.getLogger(__name__)
 
+# Streams kept in float64 regardless of the requested dtype: float32 only
+# resolves GPS coordinates to about a metre
+FLOAT64_FOURCCS = frozenset({"GPS5", "GPS9"})
+
+# Significant digits written per value in CSV exports (float32 data only
+# carries about 7)
+CSV_FLOAT_FORMAT = "%.10g"
+CSV_FLOAT32_FORMAT = "%.7g"
+# gzip level for .csv.gz output: level 1 shrinks telemetry CSV about 2.6x for
+# about a third more write time, where the gzip default of 9 takes 5x longer
+CSV_GZIP_LEVEL = 1
+
+# Target size of one HDF5 chunk (the HDF5 guide recommends 10 KiB - 1 MiB)
+HDF5_CHUNK_BYTES = 128 * 1024
+HDF5_GZIP_LEVEL = 4
+
+# Characters dropped or replaced when stream names become file names, and
+# additionally commas for NPZ keys
+_FILENAME_TABLE = str.maketrans({" ": "_", "[": None, "]": None})
+_NPZ_KEY_TABLE = str.maketrans({" ": "_", "[": None, "]": None, ",": None})
+
+# zstd level for Parquet exports when none is given
+PARQUET_ZSTD_LEVEL = 3
+
+# Supported export_npz compression modes
+NPZ_COMPRESSIONS = frozenset({"gzip", "none"})
+# Deflate level for compressed NPZ files. np.savez_compressed uses 6; level 1
+# writes float telemetry about 1.6x faster for about 1% more space.
+NPZ_GZIP_LEVEL = 1
+
+# Upper bound on threads used to parse packets or write/compress exports
+EXPORT_MAX_WORKERS = 8
+
+# Packet count above which _load parses packets on a thread pool. Parsing is
+# pure Python, so threads only pay off on free-threaded (no-GIL) builds.
+PARALLEL_PARSE_MIN_PACKETS = 16
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
 
 @dataclass
 class SensorStream:
@@ -25,11 +64,93 @@ class SensorStream:
     scale: Optional[float] = None
     metadata: Dict[str, Any] = None
     model_config: Optional[ModelConfig] = None
+    # Last _column_names result with the inputs it was derived from
+    _column_cache: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
 
+    def _column_names(self, model_config: Optional[ModelConfig] = None) -> List[str]:
+        """Get the column labels used when tabulating this stream.
+
+        Args:
+            model_config: Optional ModelConfig to determine axis ordering.
+                         If not provided, uses self.model_config if available.
+
+        Returns:
+            Column names, starting with "timestamp"
+        """
+        # Use provided model_config or fall back to stored one
+        if model_config is None:
+            model_config = self.model_config
+
+        fourcc = self.metadata.get("fourcc")
+        key = (self.name, fourcc, self.data.shape[1:])
+        cache = self._column_cache
+        if cache is not None and cache[0] is model_config and cache[1] == key:
+            return list(cache[2])
+
+        column_names = self._resolve_column_names(model_config, fourcc)
+        self._column_cache = (model_config, key, column_names)
+        return list(column_names)
+
+    def _resolve_column_names(
+        self, model_config: Optional[ModelConfig], fourcc: Optional[str]
+    ) -> List[str]:
+        """Derive column labels from the model's axis order.
+
+        Args:
+            model_config: ModelConfig to determine axis ordering, if any
+            fourcc: FourCC of the stream, if known
+
+        Returns:
+            Column names, starting with "timestamp"
+        """
+        if self.data.ndim == 1:
+            return ["timestamp", self.name]
+
+        # Multi-axis data (e.g., 3-axis accelerometer)
+        num_axes = self.data.shape[1]
+
+        # Get axis labels from model config if available
+        if model_config and fourcc and fourcc in model_config.axis_order:
+            axis_names = model_config.axis_order[fourcc][:num_axes]
+            logger.debug(f"Using model-specific axis order for {fourcc}: {axis_names}")
+        else:
+            # Default fallback: standard x, y, z, w ordering
+            axis_names = ["x", "y", "z", "w"][:num_axes]
+            if fourcc:
+                logger.debug(
+                    f"No model-specific axis order for {fourcc}, using default: {axis_names}"
+                )
+
+        if len(axis_names) < num_axes:
+            # Ensure we never drop columns when axis labels are incomplete.
+            axis_names += [f"axis_{i + 1}" for i in range(len(axis_names), num_axes)]
+
+        # Use axis-only labels when model config defines them; fall back to name+axis.
+        use_axis_only = (
+            model_config is not None
+            and fourcc is not None
+            and fourcc in model_config.axis_order
+        )
+
+        column_names = ["timestamp"]
+        seen_names = {"timestamp"}
+
+        for axis in axis_names:
+            if use_axis_only and axis not in seen_names:
+                col_name = axis
+            else:
+                col_name = f"{self.name}_{axis}"
+            column_names.append(col_name)
+            seen_names.add(col_name)
+
+        return column_names
+
     def to_dataframe(
         self, set_index: bool = False, model_config: Optional[ModelConfig] = None
     ) -> pd.DataFrame:
@@ -41,72 +162,199 @@ class SensorStream:
                          If not provided, uses self.model_config if available.
 
         Returns:
-            DataFrame with sensor data columns
+            DataFrame with sensor data columns. The columns are views of
+            ``data`` and ``timestamps``; without pandas copy-on-write, call
+            ``.copy()`` before modifying the DataFrame in place.
         """
+        column_names = self._column_names(model_config)
+
+        if set_index:
+            # The whole data array becomes one 2D block and the timestamps
+            # the index, skipping the copy made by set_index
+            index = pd.Index(self.timestamps, name="timestamp", copy=False)
+            return pd.DataFrame(
+                self.data, index=index, columns=column_names[1:], copy=False
+            )
+
+        # Columns are wrapped as views of the NumPy arrays (copy=False); dicts
+        # keep insertion order, so the columns already follow axis ordering.
         if self.data.ndim == 1:
             df = pd.DataFrame(
                 {
                     "timestamp": self.timestamps,
                     self.name: self.data,
-                }
+                },
+                copy=False,
             )
         else:
-            # Multi-axis data (e.g., 3-axis accelerometer)
-            num_axes = self.data.shape[1]
+            data_dict = {"timestamp": self.timestamps}
+            for i, col_name in enumerate(column_names[1:]):
+                data_dict[col_name] = self.data[:, i]
 
-            # Use provided model_config or fall back to stored one
-            if model_config is None:
-                model_config = self.model_config
+            df = pd.DataFrame(data_dict, copy=False)
 
-            # Get axis labels from model config if available
-            fourcc = self.metadata.get("fourcc")
-            if model_config and fourcc and fourcc in model_config.axis_order:
-                axis_names = model_config.axis_order[fourcc][:num_axes]
-                logger.debug(
-                    f"Using model-specific axis order for {fourcc}: {axis_names}"
-                )
-            else:
-                # Default fallback: standard x, y, z, w ordering
-                axis_names = ["x", "y", "z", "w"][:num_axes]
-                if fourcc:
-                    logger.debug(
-                        f"No model-specific axis order for {fourcc}, using default: {axis_names}"
-                    )
+        return df
+
+    def to_csv(self, filepath: str, model_config: Optional[ModelConfig] = None):
+        """Write sensor stream to a CSV file.
+
+        Numeric streams are written straight from the NumPy arrays with
+        ``np.savetxt``, skipping the intermediate DataFrame. Non-numeric
+        (object) streams fall back to pandas. Paths ending in ".gz" are
+        gzip-compressed.
 
-            if len(axis_names) < num_axes:
-                # Ensure we never drop columns when axis labels are incomplete.
-                axis_names += [
-                    f"axis_{i + 1}" for i in range(len(axis_names), num_axes)
-                ]
-
-            # Build DataFrame with explicit column order to preserve axis ordering
-            # Use axis-only labels when model config defines them; fall back to name+axis.
-            use_axis_only = (
-                model_config is not None
-                and fourcc is not None
-                and fourcc in model_config.axis_order
+        Args:
+            filepath: Path for output CSV file
+            model_config: Optional ModelConfig to determine axis ordering.
+                         If not provided, uses self.model_config if available.
+        """
+        compress = str(filepath).endswith(".gz")
+
+        if self.data.dtype == object:
+            self.to_dataframe(model_config=model_config).to_csv(
+                filepath,
+                index=False,
+                compression=(
+                    {"method": "gzip", "compresslevel": CSV_GZIP_LEVEL}
+                    if compress
+                    else None
+                ),
             )
+            return
 
-            data_dict = {"timestamp": self.timestamps}
-            column_names = ["timestamp"]
-            seen_names = {"timestamp"}
+        import csv
+        import io
 
-            for i, axis in enumerate(axis_names):
-                if use_axis_only and axis not in seen_names:
-                    col_name = axis
-                else:
-                    col_name = f"{self.name}_{axis}"
-                data_dict[col_name] = self.data[:, i]
-                column_names.append(col_name)
-                seen_names.add(col_name)
+        # Quote column names the same way pandas would (e.g. names with commas)
+        header = io.StringIO()
+        csv.writer(header, lineterminator="").writerow(self._column_names(model_config))
+
+        columns = np.column_stack([self.timestamps, self.data])
+        data_format = (
+            CSV_FLOAT32_FORMAT if self.data.dtype == np.float32 else CSV_FLOAT_FORMAT
+        )
+        savetxt_kwargs = dict(
+            fmt=[CSV_FLOAT_FORMAT] + [data_format] * (columns.shape[1] - 1),
+            delimiter=",",
+            header=header.getvalue(),
+            comments="",
+            encoding="utf-8",
+        )
+        if compress:
+            import gzip
 
-            # Create DataFrame and explicitly reorder columns to match axis_names order
-            df = pd.DataFrame(data_dict)
-            df = df[column_names]  # Reorder columns to match our specified order
+            # np.savetxt would gzip ".gz" paths itself, but at level 9
+            with gzip.open(filepath, "wb", compresslevel=CSV_GZIP_LEVEL) as f:
+                np.savetxt(f, columns, **savetxt_kwargs)
+        else:
+            np.savetxt(filepath, columns, **savetxt_kwargs)
+
+
+def _is_uniform_sample_arrays(data_list: List) -> bool:
+    """Check whether all entries are sample arrays with the same row shape."""
+    first = data_list[0]
+    if not isinstance(first, np.ndarray) or first.ndim == 0:
+        return False
+    row_shape = first.shape[1:]
+    return all(
+        isinstance(item, np.ndarray) and item.ndim and item.shape[1:] == row_shape
+        for item in data_list
+    )
+
+
+def _map_threaded(func: Callable, items: Sequence) -> List:
+    """Apply func to each item on a thread pool, returning results in order.
+
+    Used for export work that releases the GIL (file I/O, zlib, Arrow), and
+    for packet parsing on free-threaded builds.
+
+    Args:
+        func: Function of one argument
+        items: Items to process
+
+    Returns:
+        List of results in the order of items
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max(1, min(EXPORT_MAX_WORKERS, len(items)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _savez_deflated(output_path: str, arrays: Dict[str, Any], level: int):
+    """Write arrays to a deflate-compressed NPZ file at the given level.
+
+    Equivalent to np.savez_compressed, which does not expose the level.
+
+    Args:
+        output_path: Path for the NPZ file (".npz" is appended if missing)
+        arrays: Mapping of array names to array-like values
+        level: zlib compression level (1-9)
+    """
+    import zipfile
+
+    output_path = str(output_path)
+    if not output_path.endswith(".npz"):
+        output_path += ".npz"
+
+    with zipfile.ZipFile(
+        output_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=level
+    ) as archive:
+        for name, value in arrays.items():
+            with archive.open(f"{name}.npy", "w", force_zip64=True) as f:
+                np.lib.format.write_array(f, np.asanyarray(value), allow_pickle=True)
 
-        if set_index:
-            df = df.set_index("timestamp")
-        return df
+
+def _auto_chunk(shape: tuple, itemsize: int) -> tuple:
+    """Pick an HDF5 chunk shape of roughly HDF5_CHUNK_BYTES for a dataset.
+
+    Chunks span whole rows, so each one holds complete samples.
+
+    Args:
+        shape: Dataset shape (samples first)
+        itemsize: Size of one element in bytes
+
+    Returns:
+        Chunk shape with the same rank as the dataset
+    """
+    row_bytes = itemsize * int(np.prod(shape[1:], dtype=np.int64))
+    rows = max(1, min(shape[0], HDF5_CHUNK_BYTES // max(row_bytes, 1)))
+    return (rows, *shape[1:])
+
+
+def _write_direct_chunks(dataset, array: np.ndarray, level: int):
+    """Fill a chunked gzip+shuffle dataset using HDF5 direct chunk writes.
+
+    Each chunk is byte-shuffled and deflated here, producing exactly what
+    HDF5's shuffle and gzip filters would, then written as-is.
+
+    Args:
+        dataset: h5py Dataset created with chunks, shuffle=True and gzip
+        array: Data to write, matching the dataset's shape and dtype
+        level: gzip compression level
+    """
+    import zlib
+
+    chunk_rows = dataset.chunks[0]
+    itemsize = array.dtype.itemsize
+
+    def compress_chunk(start: int) -> bytes:
+        chunk = array[start : start + chunk_rows]
+        if chunk.shape[0] < chunk_rows:
+            # HDF5 stores edge chunks at full size
+            padded = np.zeros(dataset.chunks, dtype=array.dtype)
+            padded[: chunk.shape[0]] = chunk
+            chunk = padded
+
+        # Byte shuffle: all first bytes of each element, then all second bytes...
+        shuffled = np.ascontiguousarray(chunk).view(np.uint8).reshape(-1, itemsize).T
+        return zlib.compress(shuffled.tobytes(), level)
+
+    # Chunks are compressed in parallel; HDF5 writes stay on this thread
+    starts = range(0, array.shape[0], chunk_rows)
+    for start, payload in zip(starts, _map_threaded(compress_chunk, starts)):
+        dataset.id.write_direct_chunk((start,) + (0,) * (array.ndim - 1), payload)
 
 
 class GoProTelemetry:
@@ -121,16 +369,35 @@ class GoProTelemetry:
         metadata: Video and device metadata
         model_config: Model-specific configuration
         detected_model: Auto-detected model name (if any)
+        cache: Whether extracted packets are cached in a sidecar file
+        dtype: Floating-point dtype used for sensor data
     """
 
-    def __init__(self, filepath: str, model_config: Optional[ModelConfig] = None):
+    def __init__(
+        self,
+        filepath: str,
+        model_config: Optional[ModelConfig] = None,
+        cache: bool = False,
+        dtype: str = "float32",
+    ):
         """Initialize telemetry object.
 
         Args:
             filepath: Path to GoPro MP4 file
             model_config: Optional ModelConfig for model-specific parsing
+            cache: If True, cache extracted GPMF packets next to the video
+                   (see :func:`gopropy.extractor.extract_gpmf_stream`)
+            dtype: Floating-point dtype for scaled sensor data. GPS streams
+                   always use float64 to keep coordinate precision.
+
+        Raises:
+            ValueError: If dtype is not float32 or float64
         """
         self.filepath = Path(filepath)
+        self.cache = cache
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"dtype must be float32 or float64, got {self.dtype}")
         self.streams: Dict[str, SensorStream] = {}
         self.metadata: Dict[str, Any] = {}
         self._raw_packets: List[tuple] = []
@@ -139,13 +406,21 @@ class GoProTelemetry:
         self.detected_model: Optional[str] = None
 
     @classmethod
-    def from_file(cls, filepath: str, model: Optional[str] = None) -> "GoProTelemetry":
+    def from_file(
+        cls,
+        filepath: str,
+        model: Optional[str] = None,
+        cache: bool = False,
+        dtype: str = "float32",
+    ) -> "GoProTelemetry":
         """Load and parse telemetry from a GoPro MP4 file.
 
         Args:
             filepath: Path to the GoPro MP4 file
             model: Optional model identifier (e.g., 'HERO10', 'HERO7_BLACK').
                    If None, attempts to auto-detect from metadata.
+            cache: If True, reuse or write a ``.gpmf.cache`` sidecar file
+            dtype: Floating-point dtype for scaled sensor data
 
         Returns:
             GoProTelemetry object with parsed data
@@ -154,15 +429,19 @@ class GoProTelemetry:
         if model:
             logger.info(f"Using manually specified model: {model}")
             model_config = get_model_config(model)
-            telemetry = cls(filepath, model_config=model_config)
+            telemetry = cls(
+                filepath, model_config=model_config, cache=cache, dtype=dtype
+            )
             telemetry._load()
             return telemetry
 
         # Otherwise, attempt auto-detection
-        # First, extract a sample of GPMF data to detect model
+        # First, extract the GPMF data to detect model; the packets are reused
+        # for the full load so the file is only demuxed once
         logger.info("Attempting to auto-detect GoPro model...")
+        raw_packets = None
         try:
-            raw_packets = extract_gpmf_stream(str(filepath))
+            raw_packets = extract_gpmf_stream(str(filepath), cache=cache)
             if raw_packets:
                 # Parse first packet to get device info
                 parser = GPMFParser()
@@ -174,92 +453,124 @@ class GoProTelemetry:
                 if detected:
                     logger.info(f"Detected model: {detected}")
                     model_config = get_model_config(detected)
-                    telemetry = cls(filepath, model_config=model_config)
+                    telemetry = cls(
+                        filepath, model_config=model_config, cache=cache, dtype=dtype
+                    )
                     telemetry.detected_model = detected
-                    telemetry._load()
+                    telemetry._load(raw_packets)
                     return telemetry
                 else:
                     logger.warning("Could not detect model, using GENERIC config")
                     model_config = get_model_config("GENERIC")
-                    telemetry = cls(filepath, model_config=model_config)
-                    telemetry._load()
+                    telemetry = cls(
+                        filepath, model_config=model_config, cache=cache, dtype=dtype
+                    )
+                    telemetry._load(raw_packets)
                     return telemetry
         except Exception as e:
             logger.warning(f"Error during model detection: {e}, using GENERIC config")
             model_config = get_model_config("GENERIC")
-            telemetry = cls(filepath, model_config=model_config)
-            telemetry._load()
+            telemetry = cls(
+                filepath, model_config=model_config, cache=cache, dtype=dtype
+            )
+            telemetry._load(raw_packets)
             return telemetry
 
-    def _load(self):
-        """Load and parse all telemetry data from the file."""
-        # Extract raw GPMF packets
-        self._raw_packets = extract_gpmf_stream(str(self.filepath))
-
-        # Parse each packet and accumulate sensor data
-        all_streams: Dict[str, List] = {}
+    def _load(self, raw_packets: Optional[List[tuple]] = None):
+        """Load and parse all telemetry data from the file.
 
-        for timestamp, packet_data in self._raw_packets:
+        Args:
+            raw_packets: Already extracted (timestamp, data) GPMF packets.
+                         If None, they are extracted from the file.
+        """
+        # Extract raw GPMF packets
+        if raw_packets is None:
+            raw_packets = extract_gpmf_stream(str(self.filepath), cache=self.cache)
+        self._raw_packets = raw_packets
+
+        def parse_packet(packet: tuple) -> tuple:
+            # Payloads decode lazily; reading sample.data here keeps the NumPy
+            # decode inside the worker when packets are parsed in parallel
+            timestamp, packet_data = packet
             samples = self._parser.parse(packet_data)
-            devices = self._parser.get_device_streams(samples)
-
-            # Extract streams from all devices
-            for device_id, device_data in devices.items():
+            streams = []
+            for device_data in self._parser.get_device_streams(samples).values():
                 for stream_name, stream_data in device_data.get("streams", {}).items():
-                    if stream_name not in all_streams:
-                        all_streams[stream_name] = {
-                            "timestamps": [],
-                            "data": [],
-                            "units": stream_data.get("units"),
-                            "scale": stream_data.get("scale"),
-                            "fourcc": stream_data.get("fourcc"),
-                        }
-
-                    # Extract the actual sensor values
-                    # Only include samples that match the stream's main FourCC
+                    # Only include samples that match the stream's main FourCC,
+                    # skipping metadata samples (like ORIN, STMP)
                     stream_fourcc = stream_data.get("fourcc")
-                    for sample in stream_data.get("data", []):
-                        # Skip metadata samples (like ORIN, STMP) - only include main sensor data
-                        if stream_fourcc and sample.fourcc == stream_fourcc:
-                            all_streams[stream_name]["timestamps"].append(timestamp)
-                            all_streams[stream_name]["data"].append(sample.data)
+                    values = [
+                        sample.data
+                        for sample in stream_data.get("data", [])
+                        if stream_fourcc and sample.fourcc == stream_fourcc
+                    ]
+                    streams.append((stream_name, stream_data, values))
+            return timestamp, streams
+
+        # Parse each packet (the parser is stateless, so packets can share it)
+        if not _GIL_ENABLED and len(self._raw_packets) > PARALLEL_PARSE_MIN_PACKETS:
+            parsed = _map_threaded(parse_packet, self._raw_packets)
+        else:
+            parsed = [parse_packet(packet) for packet in self._raw_packets]
+
+        # Accumulate sensor data
+        all_streams: Dict[str, List] = {}
+
+        for timestamp, streams in parsed:
+            for stream_name, stream_data, values in streams:
+                stream_info = all_streams.get(stream_name)
+                if stream_info is None:
+                    stream_info = all_streams[stream_name] = {
+                        "timestamps": [],
+                        "data": [],
+                        "units": stream_data.get("units"),
+                        "scale": stream_data.get("scale"),
+                        "fourcc": stream_data.get("fourcc"),
+                    }
+                stream_info["data"].extend(values)
+                stream_info["timestamps"].extend([timestamp] * len(values))
 
         # Convert accumulated data to SensorStream objects
         for stream_name, stream_info in all_streams.items():
             self._create_sensor_stream(stream_name, stream_info)
 
-    def _create_sensor_stream(self, name: str, stream_info: Dict):
-        """Create a SensorStream from accumulated data.
+    def _flatten_samples(
+        self, name: str, fourcc: Optional[str], data_list: List, timestamp_list: List
+    ) -> Optional[tuple]:
+        """Flatten per-packet sample data of mixed structure into arrays.
 
         Args:
             name: Stream name
-            stream_info: Dictionary with timestamps, data, units, scale
-        """
-        data_list = stream_info["data"]
-        timestamp_list = stream_info["timestamps"]
-
-        if not data_list:
-            return
+            fourcc: Stream FourCC, used to look up the expected axis count
+            data_list: Parsed data of each packet
+            timestamp_list: Timestamp of each packet
 
+        Returns:
+            Tuple of (data, timestamps) arrays, or None if nothing is numeric
+        """
         # Flatten the data structure
         # Each entry in data_list can be:
         # - A scalar (single value)
+        # - A 1-D array of scalar samples or 2-D array of multi-axis samples
         # - A list/tuple of scalars (multi-axis single sample)
         # - A list of lists/tuples (multiple multi-axis samples)
         flat_data = []
         flat_timestamps = []
 
-        fourcc = stream_info.get("fourcc")
         axis_order_len = None
         if self.model_config and fourcc in self.model_config.axis_order:
             axis_order_len = len(self.model_config.axis_order[fourcc])
 
         for ts, item in zip(timestamp_list, data_list):
-            # Skip non-numeric data (strings, bytes, etc.)
-            if isinstance(item, (str, bytes)):
+            # Parsed numeric samples are checked first: one row (or value)
+            # per sample, so no per-sample heuristics are needed
+            if isinstance(item, np.ndarray):
+                flat_data.extend(item)
+                flat_timestamps.extend([ts] * len(item))
+            elif isinstance(item, (str, bytes)):
+                # Skip non-numeric data (strings, bytes, etc.)
                 continue
-
-            if isinstance(item, (list, tuple)):
+            elif isinstance(item, (list, tuple)):
                 if len(item) == 0:
                     continue
                 # Check if this is a list of samples or a single multi-axis sample
@@ -301,28 +612,79 @@ class GoProTelemetry:
                 flat_timestamps.append(ts)
 
         if not flat_data:
-            return
+            return None
 
-        # Convert to numpy arrays
+        # Convert to numpy arrays; timestamps are filled straight into a
+        # float64 buffer of known length
+        timestamps = np.fromiter(
+            flat_timestamps, dtype=np.float64, count=len(flat_timestamps)
+        )
         try:
             data = np.array(flat_data)
-            timestamps = np.array(flat_timestamps)
         except (ValueError, TypeError) as e:
             # If conversion fails, store as object array
             print(f"Warning: Could not convert {name} to numeric array: {e}")
             data = np.array(flat_data, dtype=object)
-            timestamps = np.array(flat_timestamps)
 
-        # Apply scaling if provided
+        return data, timestamps
+
+    def _create_sensor_stream(self, name: str, stream_info: Dict):
+        """Create a SensorStream from accumulated data.
+
+        Args:
+            name: Stream name
+            stream_info: Dictionary with timestamps, data, units, scale
+        """
+        data_list = stream_info["data"]
+        timestamp_list = stream_info["timestamps"]
+
+        if not data_list:
+            return
+
+        fourcc = stream_info.get("fourcc")
         scale = stream_info.get("scale")
+
+        # Scaled and floating-point values use the configured dtype, except
+        # for streams whose precision needs float64 (GPS coordinates)
+        float_dtype = np.dtype(np.float64) if fourcc in FLOAT64_FOURCCS else self.dtype
+
+        if _is_uniform_sample_arrays(data_list):
+            # Fast path: parsed sample arrays of one width are joined in one
+            # copy, with each packet timestamp repeated for its samples.
+            # Scaled streams are cast to the float dtype during that copy.
+            data = np.concatenate(
+                data_list, dtype=float_dtype if scale is not None else None
+            )
+            timestamps = np.repeat(
+                np.asarray(timestamp_list, dtype=np.float64),
+                [len(item) for item in data_list],
+            )
+        else:
+            flattened = self._flatten_samples(name, fourcc, data_list, timestamp_list)
+            if flattened is None:
+                return
+            data, timestamps = flattened
+
+        # Apply scaling if provided
         if scale is not None and data.dtype != object:
+            # data is a fresh array from either path above, so it is scaled
+            # in place
+            data = data.astype(float_dtype, copy=False)
             if isinstance(scale, (list, tuple)):
                 # Different scale for each axis
-                scale_array = np.array(scale)
-                data = data.astype(float) / scale_array
+                scale_array = np.array(scale, dtype=float_dtype)
+                if data.ndim == 2 and data.shape[1] == len(scale_array):
+                    # Column by column: broadcasting over a last axis of only
+                    # a few values is several times slower
+                    for axis, axis_scale in enumerate(scale_array):
+                        data[:, axis] /= axis_scale
+                else:
+                    data = data / scale_array
             else:
                 # Single scale for all values
-                data = data.astype(float) / scale
+                data /= float_dtype.type(scale)
+        elif data.dtype.kind == "f":
+            data = data.astype(float_dtype, copy=False)
 
         # Store FourCC in metadata for axis ordering
         metadata = {"fourcc": stream_info.get("fourcc")}
@@ -402,8 +764,13 @@ class GoProTelemetry:
     def to_dict(self) -> Dict[str, Any]:
         """Convert telemetry data to a dictionary.
 
+        Arrays are converted to nested Python lists, which allocates one
+        Python float per value and is slow and memory-hungry for long
+        recordings. Use :attr:`streams` for the NumPy arrays, or
+        :meth:`export_json` to write JSON without the conversion.
+
         Returns:
-            Dictionary with stream names as keys and data arrays as values
+            Dictionary with stream names as keys and data lists as values
         """
         return {
             name: {
@@ -416,40 +783,183 @@ class GoProTelemetry:
             for name, stream in self.streams.items()
         }
 
-    def export_csv(self, output_dir: str, streams: Optional[List[str]] = None):
+    def export_csv(
+        self,
+        output_dir: str,
+        streams: Optional[List[str]] = None,
+        compression: Optional[str] = None,
+    ):
         """Export telemetry data to CSV files.
 
-        Each stream is exported to a separate CSV file.
+        Each stream is exported to a separate CSV file. Files are written
+        concurrently on a thread pool.
 
         Args:
             output_dir: Directory for output CSV files
             streams: List of stream names to export (default: all)
+            compression: None for plain ".csv" files, or "gzip" to write
+                         ".csv.gz" files (about 2.6x smaller, readable with
+                         pandas.read_csv)
         """
         import os
 
+        if compression not in (None, "gzip"):
+            raise ValueError(
+                f"Unknown CSV compression {compression!r}, expected None or 'gzip'"
+            )
+        extension = ".csv.gz" if compression == "gzip" else ".csv"
+
         os.makedirs(output_dir, exist_ok=True)
 
-        dfs = self.to_dataframe(streams)
-        for stream_name, df in dfs.items():
+        if streams is None:
+            streams = self.list_streams()
+
+        def write_stream(stream_name: str) -> str:
+            stream = self.get_stream(stream_name)
             # Sanitize filename
-            filename = stream_name.replace(" ", "_").replace("[", "").replace("]", "")
-            filepath = os.path.join(output_dir, f"{filename}.csv")
-            df.to_csv(filepath, index=False)
+            filename = stream_name.translate(_FILENAME_TABLE)
+            filepath = os.path.join(output_dir, filename + extension)
+            stream.to_csv(filepath, model_config=self.model_config)
+            return filepath
+
+        for filepath in _map_threaded(write_stream, streams):
             print(f"  Exported {filepath}")
 
     def export_json(self, output_path: str):
         """Export telemetry data to JSON file.
 
+        The output has the same layout as :meth:`to_dict`. When orjson is
+        installed, NumPy arrays are serialized directly instead of being
+        converted to Python lists first.
+
         Args:
             output_path: Path for output JSON file
         """
-        import json
+        try:
+            import orjson
+        except ImportError:
+            import json
+
+            data = self.to_dict()
+            with open(output_path, "w") as f:
+                json.dump(data, f, indent=2)
+            return
+
+        payload = {
+            name: {
+                # orjson only serializes contiguous arrays of native dtypes
+                "data": (
+                    stream.data.tolist()
+                    if stream.data.dtype == object
+                    else np.ascontiguousarray(stream.data)
+                ),
+                "timestamps": np.ascontiguousarray(stream.timestamps),
+                "units": stream.units,
+                "scale": stream.scale,
+                "metadata": stream.metadata,
+            }
+            for name, stream in self.streams.items()
+        }
+        with open(output_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+                )
+            )
 
-        data = self.to_dict()
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+    def export_parquet(
+        self,
+        output_dir: str,
+        streams: Optional[List[str]] = None,
+        compression: str = "zstd",
+        compression_level: Optional[int] = None,
+    ):
+        """Export telemetry data to Parquet files.
 
-    def export_hdf5(self, output_path: str, streams: Optional[List[str]] = None):
+        Each stream is exported to a separate Parquet file with the same
+        columns as :meth:`SensorStream.to_dataframe`. Stream units and FourCC
+        are stored in the file's schema metadata. Files are written
+        concurrently on a thread pool.
+
+        Args:
+            output_dir: Directory for output Parquet files
+            streams: List of stream names to export (default: all)
+            compression: Parquet compression codec (e.g. 'zstd', 'snappy',
+                         'none')
+            compression_level: Codec-specific compression level (default:
+                               PARQUET_ZSTD_LEVEL for zstd, the codec's own
+                               default otherwise). Codecs such as snappy
+                               do not accept a level.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for Parquet export. "
+                "Install it with: pip install gopropy[parquet]"
+            )
+        import os
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        if compression_level is None and compression == "zstd":
+            compression_level = PARQUET_ZSTD_LEVEL
+
+        if streams is None:
+            streams = self.list_streams()
+
+        def write_stream(stream_name: str) -> Optional[str]:
+            stream = self.get_stream(stream_name)
+            if stream.data.dtype == object:
+                logger.warning(f"Skipping {stream_name} (non-numeric data)")
+                return None
+
+            columns = [stream.timestamps]
+            if stream.data.ndim == 1:
+                columns.append(stream.data)
+            else:
+                columns.extend(stream.data.T)
+
+            table = pa.Table.from_arrays(
+                [pa.array(column) for column in columns],
+                names=stream._column_names(self.model_config),
+            )
+            table = table.replace_schema_metadata(
+                {
+                    "video_file": self.filepath.name,
+                    "stream": stream_name,
+                    "units": stream.units or "",
+                    "fourcc": stream.metadata.get("fourcc") or "",
+                }
+            )
+
+            # Sanitize filename
+            filename = stream_name.translate(_FILENAME_TABLE)
+            filepath = os.path.join(output_dir, f"{filename}.parquet")
+            pq.write_table(
+                table,
+                filepath,
+                compression=compression,
+                compression_level=compression_level,
+            )
+            return filepath
+
+        for filepath in _map_threaded(write_stream, streams):
+            if filepath is not None:
+                print(f"  Exported {filepath}")
+
+    def export_hdf5(
+        self,
+        output_path: str,
+        streams: Optional[List[str]] = None,
+        direct_chunk_write: bool = False,
+        compression: Any = "gzip",
+        compression_opts: Any = None,
+    ):
         """Export telemetry data to HDF5 file.
 
         Each stream is stored as a separate dataset in the HDF5 file.
@@ -457,9 +967,23 @@ class GoProTelemetry:
         Args:
             output_path: Path for output HDF5 file
             streams: List of stream names to export (default: all)
+            direct_chunk_write: If True, shuffle and gzip each chunk in Python
+                and write it with HDF5's direct chunk write, bypassing the
+                HDF5 filter pipeline. Datasets written this way have no
+                Fletcher-32 checksum. Requires compression="gzip".
+            compression: HDF5 compression filter (default: "gzip", readable
+                by any HDF5 tool). "lzf" writes about twice as fast, but the
+                filter only ships with h5py: MATLAB, HDFView and the HDF5
+                command line tools need a plugin to read it. None disables
+                compression; an hdf5plugin filter such as
+                ``hdf5plugin.Blosc(cname="zstd")`` gives multi-threaded
+                compression with a better ratio.
+            compression_opts: Options for the compression filter (default:
+                level 4 for "gzip", none otherwise)
 
         Raises:
             ImportError: If h5py is not installed
+            ValueError: If direct_chunk_write is used without gzip compression
         """
         try:
             import h5py
@@ -468,6 +992,11 @@ class GoProTelemetry:
                 "h5py is required for HDF5 export. Install it with: pip install h5py"
             )
 
+        if direct_chunk_write and compression != "gzip":
+            raise ValueError("direct_chunk_write requires compression='gzip'")
+        if compression == "gzip" and compression_opts is None:
+            compression_opts = HDF5_GZIP_LEVEL
+
         if streams is None:
             streams = self.list_streams()
 
@@ -485,11 +1014,37 @@ class GoProTelemetry:
                 # Create group for this stream
                 grp = f.create_group(stream_name.replace("/", "_"))
 
-                # Store data
-                grp.create_dataset("data", data=stream.data, compression="gzip")
-                grp.create_dataset(
-                    "timestamps", data=stream.timestamps, compression="gzip"
-                )
+                # Store data in chunked, shuffled, compressed datasets
+                for key, array in (
+                    ("data", stream.data),
+                    ("timestamps", stream.timestamps),
+                ):
+                    chunks = _auto_chunk(array.shape, array.dtype.itemsize)
+                    if direct_chunk_write and array.dtype != object:
+                        dset = grp.create_dataset(
+                            key,
+                            shape=array.shape,
+                            dtype=array.dtype,
+                            chunks=chunks,
+                            compression="gzip",
+                            compression_opts=compression_opts,
+                            shuffle=True,
+                        )
+                        if hasattr(dset.id, "write_direct_chunk"):
+                            _write_direct_chunks(dset, array, compression_opts)
+                        else:
+                            dset[...] = array
+                        continue
+
+                    grp.create_dataset(
+                        key,
+                        data=array,
+                        chunks=chunks,
+                        compression=compression,
+                        compression_opts=compression_opts,
+                        shuffle=compression is not None,
+                        fletcher32=True,
+                    )
 
                 # Store metadata as attributes
                 if stream.units:
@@ -503,7 +1058,12 @@ class GoProTelemetry:
                 grp.attrs["shape"] = stream.data.shape
                 grp.attrs["dtype"] = str(stream.data.dtype)
 
-    def export_npz(self, output_path: str, streams: Optional[List[str]] = None):
+    def export_npz(
+        self,
+        output_path: str,
+        streams: Optional[List[str]] = None,
+        compression: str = "gzip",
+    ):
         """Export telemetry data to NumPy NPZ file.
 
         Each stream is stored with keys: '<stream_name>_data' and '<stream_name>_timestamps'.
@@ -511,7 +1071,16 @@ class GoProTelemetry:
         Args:
             output_path: Path for output NPZ file
             streams: List of stream names to export (default: all)
+            compression: "gzip" for a deflate-compressed archive, or "none" to
+                         store arrays uncompressed (larger, but much faster to
+                         write and load)
         """
+        if compression not in NPZ_COMPRESSIONS:
+            raise ValueError(
+                f"Unknown NPZ compression {compression!r}, "
+                f"expected one of {sorted(NPZ_COMPRESSIONS)}"
+            )
+
         if streams is None:
             streams = self.list_streams()
 
@@ -528,12 +1097,7 @@ class GoProTelemetry:
                 continue
 
             # Sanitize key names (replace spaces and special chars)
-            key_base = (
-                stream_name.replace(" ", "_")
-                .replace("[", "")
-                .replace("]", "")
-                .replace(",", "")
-            )
+            key_base = stream_name.translate(_NPZ_KEY_TABLE)
 
             data_dict[f"{key_base}_data"] = stream.data
             data_dict[f"{key_base}_timestamps"] = stream.timestamps
@@ -544,7 +1108,10 @@ class GoProTelemetry:
             if stream.scale is not None:
                 data_dict[f"{key_base}_scale"] = np.array(stream.scale)
 
-        np.savez_compressed(output_path, **data_dict)
+        if compression == "none":
+            np.savez(output_path, **data_dict)
+        else:
+            _savez_deflated(output_path, data_dict, NPZ_GZIP_LEVEL)
 
     def __repr__(self) -> str:
         """String representation of the telemetry object."""
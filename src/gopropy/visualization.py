@@ -9,6 +9,9 @@ from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from .telemetry import GoProTelemetry
 
+# Characters replaced or dropped when stream names become entity paths
+_ENTITY_NAME_TABLE = str.maketrans({" ": "_", "[": None, "]": None})
+
 
 def to_rerun(
     telemetry: "GoProTelemetry",
@@ -23,7 +26,9 @@ def to_rerun(
 
     Args:
         telemetry: GoProTelemetry object with parsed data
-        video_path: Optional path to video file for synchronized playback
+        video_path: Optional path to video file for synchronized playback.
+                    Rerun loads the whole file into memory. Videos it cannot
+                    read are skipped with a warning.
         app_id: Rerun application ID (only used if you haven't called rr.init())
 
     Example:
@@ -49,10 +54,6 @@ def to_rerun(
             "Install it with: pip install gopropy[visualization]"
         )
 
-    # Log video if path provided
-    if video_path:
-        _log_video(video_path)
-
     # Log each sensor stream
     for stream_name in telemetry.list_streams():
         stream = telemetry.get_stream(stream_name)
@@ -61,46 +62,48 @@ def to_rerun(
 
         _log_stream_to_rerun(stream_name, stream)
 
+    # Log video if path provided (after the streams, so they are logged even
+    # if the video cannot be)
+    if video_path:
+        _log_video(video_path)
 
-def _log_video(video_path: str):
-    """Log video frames to Rerun."""
-    try:
-        import rerun as rr
-        import cv2
-    except ImportError:
-        print("Warning: opencv-python required for video logging, skipping video")
-        return
-
-    cap = cv2.VideoCapture(video_path)
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    frame_idx = 0
-
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
 
-        # Convert BGR to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+def _log_video(video_path: str):
+    """Log a video to Rerun as an asset with one reference per frame.
 
-        # Log frame with timestamp
-        timestamp_sec = frame_idx / fps
-        rr.set_time("video_time", timestamp=timestamp_sec)
-        rr.log("video/frame", rr.Image(frame_rgb))
+    The encoded video is sent once and decoded by the viewer, so no frames
+    are decoded in Python. Note that Rerun reads the whole file into memory
+    (and into the recording), which for long GoPro recordings can be
+    several GB. Videos Rerun cannot read (e.g. unsupported codecs) are
+    skipped with a warning.
+    """
+    import rerun as rr
 
-        frame_idx += 1
+    try:
+        video_asset = rr.AssetVideo(path=video_path)
+        frame_timestamps_ns = video_asset.read_frame_timestamps_nanos()
+    except Exception as e:
+        print(f"Warning: could not read video {video_path} ({e}), skipping video")
+        return
 
-        # Limit to reasonable frame count for demo
-        if frame_idx > 1000:  # ~16 seconds at 60fps
-            print(f"Logged {frame_idx} video frames (limited for demo)")
-            break
+    rr.log("video/frame", video_asset, static=True)
 
-    cap.release()
-    print(f"Logged {frame_idx} video frames at {fps:.1f} fps")
+    # Reference every frame on the video timeline in a single call
+    rr.send_columns(
+        "video/frame",
+        indexes=[rr.TimeColumn("video_time", timestamp=1e-9 * frame_timestamps_ns)],
+        columns=rr.VideoFrameReference.columns_nanos(frame_timestamps_ns),
+    )
+    print(f"Logged video with {len(frame_timestamps_ns)} frames")
 
 
 def _log_stream_to_rerun(stream_name: str, stream):
-    """Log a single sensor stream to Rerun."""
+    """Log a single sensor stream to Rerun.
+
+    Each component is sent as a single column with ``rr.send_columns``
+    rather than logging sample by sample.
+    """
+    import numpy as np
     import rerun as rr
 
     # Skip non-numeric data
@@ -109,69 +112,70 @@ def _log_stream_to_rerun(stream_name: str, stream):
         return
 
     # Create entity path (replace special chars)
-    entity_path = (
-        f"sensors/{stream_name.replace(' ', '_').replace('[', '').replace(']', '')}"
-    )
+    entity_path = f"sensors/{stream_name.translate(_ENTITY_NAME_TABLE)}"
+
+    # Send each component as one column over the whole stream
+    times = [rr.TimeColumn("telemetry_time", timestamp=stream.timestamps)]
+
+    def send_scalars(name: str, values):
+        rr.send_columns(
+            f"{entity_path}/{name}",
+            indexes=times,
+            columns=rr.Scalars.columns(scalars=values),
+        )
 
-    # Log data points
-    for i, (timestamp, values) in enumerate(zip(stream.timestamps, stream.data)):
-        rr.set_time("telemetry_time", timestamp=float(timestamp))
-
-        if stream.data.ndim == 1:
-            # Scalar data
-            rr.log(f"{entity_path}/value", rr.Scalars([float(values)]))
-
-        elif stream.data.ndim == 2:
-            num_axes = stream.data.shape[1]
-
-            # Log based on data dimensions
-            if num_axes == 3:
-                # 3D vector (accelerometer, gyroscope, etc.)
-                rr.log(
-                    f"{entity_path}/vector",
-                    rr.Arrows3D(
-                        origins=[[0, 0, 0]],
-                        vectors=[values.tolist()],
-                    ),
-                )
-                # Also log individual components
-                rr.log(f"{entity_path}/x", rr.Scalars([float(values[0])]))
-                rr.log(f"{entity_path}/y", rr.Scalars([float(values[1])]))
-                rr.log(f"{entity_path}/z", rr.Scalars([float(values[2])]))
-
-            elif num_axes == 4:
-                # 4D data (quaternions, etc.)
-                rr.log(f"{entity_path}/w", rr.Scalars([float(values[0])]))
-                rr.log(f"{entity_path}/x", rr.Scalars([float(values[1])]))
-                rr.log(f"{entity_path}/y", rr.Scalars([float(values[2])]))
-                rr.log(f"{entity_path}/z", rr.Scalars([float(values[3])]))
-
-            elif num_axes == 5 and "GPS" in stream_name:
-                # GPS data (lat, lon, alt, speed2d, speed3d)
-                rr.log(f"{entity_path}/latitude", rr.Scalars([float(values[0])]))
-                rr.log(f"{entity_path}/longitude", rr.Scalars([float(values[1])]))
-                rr.log(f"{entity_path}/altitude", rr.Scalars([float(values[2])]))
-                rr.log(f"{entity_path}/speed_2d", rr.Scalars([float(values[3])]))
-                rr.log(f"{entity_path}/speed_3d", rr.Scalars([float(values[4])]))
-
-                # Log as 3D point (for map view)
-                # Convert lat/lon to approximate local coords (simplified)
-                # In production, you'd use proper projection
-                rr.log(
-                    f"{entity_path}/position",
-                    rr.Points3D(
-                        [[float(values[1]), float(values[0]), float(values[2])]],
-                        radii=[2.0],
-                    ),
-                )
-
-            else:
-                # Generic multi-axis data - log each axis
-                for axis_idx in range(num_axes):
-                    rr.log(
-                        f"{entity_path}/axis_{axis_idx}",
-                        rr.Scalars([float(values[axis_idx])]),
-                    )
+    data = stream.data
+    if data.ndim == 1:
+        # Scalar data
+        send_scalars("value", data)
+
+    elif data.ndim == 2:
+        num_axes = data.shape[1]
+
+        # Log based on data dimensions
+        if num_axes == 3:
+            # 3D vector (accelerometer, gyroscope, etc.)
+            rr.send_columns(
+                f"{entity_path}/vector",
+                indexes=times,
+                # Arrows start at the origin by default, so no origins column
+                columns=rr.Arrows3D.columns(vectors=data),
+            )
+            # Also log individual components
+            for axis_idx, axis in enumerate(("x", "y", "z")):
+                send_scalars(axis, data[:, axis_idx])
+
+        elif num_axes == 4:
+            # 4D data (quaternions, etc.)
+            for axis_idx, axis in enumerate(("w", "x", "y", "z")):
+                send_scalars(axis, data[:, axis_idx])
+
+        elif num_axes in (5, 9) and "GPS" in stream_name:
+            # GPS5 (lat, lon, alt, speed2d, speed3d) or GPS9, which adds
+            # days, seconds, DOP and fix
+            axes = ("latitude", "longitude", "altitude", "speed_2d", "speed_3d")
+            if num_axes == 9:
+                axes += ("days", "seconds", "dop", "fix")
+            for axis_idx, axis in enumerate(axes):
+                send_scalars(axis, data[:, axis_idx])
+
+            # Log as 3D point (for map view)
+            # Convert lat/lon to approximate local coords (simplified)
+            # In production, you'd use proper projection
+            positions = np.ascontiguousarray(data[:, [1, 0, 2]], dtype=np.float32)
+            rr.send_columns(
+                f"{entity_path}/position",
+                indexes=times,
+                columns=rr.Points3D.columns(
+                    positions=positions,
+                    radii=np.full(len(data), 2.0, dtype=np.float32),
+                ),
+            )
+
+        else:
+            # Generic multi-axis data - log each axis
+            for axis_idx in range(num_axes):
+                send_scalars(f"axis_{axis_idx}", data[:, axis_idx])
 
     print(f"Logged {len(stream.timestamps)} samples for {stream_name}")
 
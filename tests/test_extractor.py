@@ -0,0 +1,52 @@
+"""Tests for the GPMF packet cache."""
+
+import os
+
+from gopropy import extractor
+
+PACKETS = [(0.0, b"DEVC"), (1.001, b"STRM\x00\x01")]
+
+
+def test_cache_round_trip(tmp_path, monkeypatch):
+    video = tmp_path / "GX010001.MP4"
+    video.write_bytes(b"video")
+    monkeypatch.setattr(extractor, "_extract_packets", lambda path: PACKETS)
+
+    assert extractor.extract_gpmf_stream(str(video), cache=True) == PACKETS
+    assert (tmp_path / "GX010001.MP4.gpmf.cache").exists()
+
+    monkeypatch.setattr(extractor, "_extract_packets", lambda path: 1 / 0)
+    cached = extractor.extract_gpmf_stream(str(video), cache=True)
+    assert [(t, bytes(data)) for t, data in cached] == PACKETS
+
+
+def test_cache_rejected_for_other_video(tmp_path):
+    video = tmp_path / "GX010001.MP4"
+    video.write_bytes(b"video")
+    cache_path = tmp_path / "GX010001.MP4.gpmf.cache"
+    extractor._write_cache(cache_path, PACKETS, video.stat())
+    stat = video.stat()
+
+    # Same name and an older mtime, but a different size (another card)
+    video.write_bytes(b"other video")
+    os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+    assert extractor._read_cache(cache_path, video.stat()) is None
+
+    # Same size, different mtime
+    video.write_bytes(b"video")
+    assert extractor._read_cache(cache_path, video.stat()) is None
+
+    os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert extractor._read_cache(cache_path, video.stat()) is not None
+
+
+def test_cache_path_keeps_video_extension(tmp_path, monkeypatch):
+    monkeypatch.setattr(extractor, "_extract_packets", lambda path: PACKETS)
+    for name in ("a.MP4", "a.MOV"):
+        (tmp_path / name).write_bytes(b"video")
+        extractor.extract_gpmf_stream(str(tmp_path / name), cache=True)
+
+    assert sorted(p.name for p in tmp_path.glob("*.gpmf.cache")) == [
+        "a.MOV.gpmf.cache",
+        "a.MP4.gpmf.cache",
+    ]
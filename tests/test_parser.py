@@ -0,0 +1,27 @@
+"""Tests for GPMF sample parsing."""
+
+import pickle
+import struct
+
+import numpy as np
+
+from gopropy.parser import GPMFParser
+
+
+def test_samples_pickle_and_decode():
+    accl = b"ACCLs\x06\x00\x02" + struct.pack(">6h", 1, 2, 3, 4, 5, 6)
+    devc = b"DEVC\x00\x04\x00\x05" + accl
+    (sample,) = GPMFParser().parse(devc)
+
+    restored = pickle.loads(pickle.dumps(sample))
+
+    assert restored == sample
+    (child,) = restored.data
+    np.testing.assert_array_equal(child.data, [[1, 2, 3], [4, 5, 6]])
+
+
+def test_sample_repr_omits_raw_view():
+    (sample,) = GPMFParser().parse(b"DVID" + b"L\x04\x00\x01" + struct.pack(">L", 7))
+
+    assert "memory at" not in repr(sample)
+    assert "DVID" in repr(sample)
@@ -0,0 +1,110 @@
+"""Tests for loading sensor streams from GPMF packets."""
+
+import struct
+
+import numpy as np
+import pytest
+
+from gopropy.telemetry import GoProTelemetry
+
+
+def klv(fourcc: str, type_code: str, size: int, repeat: int, payload: bytes) -> bytes:
+    """Encode one GPMF KLV entry, padded to a 4-byte boundary."""
+    header = fourcc.encode() + type_code.encode() + struct.pack(">BH", size, repeat)
+    return header + payload + b"\0" * (-len(payload) % 4)
+
+
+def nest(fourcc: str, children: list) -> bytes:
+    """Encode a nested GPMF container."""
+    body = b"".join(children)
+    return klv(fourcc, "\0", 4, len(body) // 4, body)
+
+
+def gps5_packet(scal: bytes, scal_type: str, scal_repeat: int) -> bytes:
+    """Build a DEVC packet holding a two-sample GPS5 stream."""
+    gps = struct.pack(">5l", 377654321, -1224321234, 12345, 100, 120) * 2
+    stream = nest(
+        "STRM",
+        [
+            klv("STNM", "c", 1, 3, b"GPS"),
+            klv("SCAL", scal_type, 4, scal_repeat, scal),
+            klv("GPS5", "l", 20, 2, gps),
+        ],
+    )
+    return nest("DEVC", [klv("DVID", "L", 4, 1, struct.pack(">L", 1)), stream])
+
+
+def load(packets: list) -> GoProTelemetry:
+    telemetry = GoProTelemetry("GX010001.MP4")
+    telemetry._load(packets)
+    return telemetry
+
+
+def test_gps5_with_scalar_scale():
+    packet = gps5_packet(struct.pack(">l", 10), "l", 1)
+    stream = load([(0.0, packet), (1.0, packet)]).get_stream("GPS")
+
+    assert stream.data.dtype == np.float64
+    assert stream.data.shape == (4, 5)
+    np.testing.assert_allclose(
+        stream.data[0], [37765432.1, -122432123.4, 1234.5, 10, 12]
+    )
+    np.testing.assert_array_equal(stream.timestamps, [0.0, 0.0, 1.0, 1.0])
+
+
+def test_gps5_with_per_axis_scale():
+    scal = struct.pack(">5l", 10000000, 10000000, 1000, 1000, 100)
+    stream = load([(0.0, gps5_packet(scal, "l", 5))]).get_stream("GPS")
+
+    assert stream.data.dtype == np.float64
+    np.testing.assert_allclose(
+        stream.data[0], [37.7654321, -122.4321234, 12.345, 0.1, 1.2]
+    )
+
+
+def test_default_dtype_is_float32():
+    assert GoProTelemetry("GX010001.MP4").dtype == np.float32
+
+
+@pytest.mark.parametrize("dtype", ["int16", "float16", "longdouble"])
+def test_unsupported_dtype_rejected(dtype):
+    with pytest.raises(ValueError, match="float32 or float64"):
+        GoProTelemetry("GX010001.MP4", dtype=dtype)
+
+
+def test_scalar_streams_keep_one_value_per_sample():
+    shut = nest(
+        "STRM",
+        [
+            klv("STNM", "c", 1, 13, b"Exposure time"),
+            klv("SHUT", "f", 4, 4, struct.pack(">4f", 0.001, 0.002, 0.003, 0.004)),
+        ],
+    )
+    iso = nest(
+        "STRM",
+        [
+            klv("STNM", "c", 1, 3, b"ISO"),
+            klv("ISOE", "S", 2, 3, struct.pack(">3H", 100, 200, 400)),
+        ],
+    )
+    packet = nest("DEVC", [klv("DVID", "L", 4, 1, struct.pack(">L", 1)), shut, iso])
+    telemetry = load([(0.0, packet), (1.0, packet)])
+
+    assert telemetry.get_stream("Exposure time").data.shape == (8,)
+    iso_data = telemetry.get_stream("ISO").data
+    assert iso_data.dtype == np.uint16
+    np.testing.assert_array_equal(iso_data, [100, 200, 400] * 2)
+
+
+@pytest.mark.parametrize("compression", ["zstd", "snappy", "none"])
+def test_export_parquet_round_trip(tmp_path, compression):
+    pq = pytest.importorskip("pyarrow.parquet")
+    packet = gps5_packet(struct.pack(">l", 10), "l", 1)
+    telemetry = load([(0.0, packet), (1.0, packet)])
+
+    telemetry.export_parquet(str(tmp_path), compression=compression)
+
+    table = pq.read_table(tmp_path / "GPS.parquet")
+    stream = telemetry.get_stream("GPS")
+    np.testing.assert_array_equal(table.column("timestamp"), stream.timestamps)
+    assert table.num_columns == 6
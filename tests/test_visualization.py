@@ -0,0 +1,27 @@
+"""Tests for logging telemetry to Rerun."""
+
+import numpy as np
+import pytest
+
+from gopropy.telemetry import GoProTelemetry, SensorStream
+
+rr = pytest.importorskip("rerun")
+
+
+def test_unreadable_video_is_skipped(tmp_path, capsys):
+    from gopropy.visualization import to_rerun
+
+    telemetry = GoProTelemetry("GX010001.MP4")
+    telemetry.streams["ISO"] = SensorStream(
+        "ISO", np.array([100, 200], dtype=np.uint16), np.array([0.0, 1.0])
+    )
+    video = tmp_path / "GX010001.MP4"
+    video.write_bytes(b"not a video")
+
+    rr.init("gopropy_test")
+    rr.memory_recording()
+    to_rerun(telemetry, video_path=str(video))
+
+    output = capsys.readouterr().out
+    assert "Logged 2 samples for ISO" in output
+    assert "skipping video" in output